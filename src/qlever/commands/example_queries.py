@@ -14,6 +14,15 @@ from qlever.commands.clear_cache import ClearCacheCommand
 from qlever.log import log, mute_log
 from qlever.util import run_command, run_curl_command
 
+# Regexes applied to each example query, compiled once at module load (and not
+# for each query).
+OFFSET_REGEX = re.compile(r"OFFSET\s+\d+\s*", re.IGNORECASE)
+LIMIT_REGEX = re.compile(r"LIMIT\s+\d+\s*", re.IGNORECASE)
+FROM_CLAUSE_REGEX = re.compile(r"\s*FROM\s+<[^>]+>\s*", re.IGNORECASE)
+SELECT_REGEX = re.compile(r"SELECT ", re.IGNORECASE)
+WHITESPACE_REGEX = re.compile(r"\s+")
+DOT_BEFORE_CLOSING_BRACKET_REGEX = re.compile(r"\s*\.\s*\}")
+
 
 class ExampleQueriesCommand(QleverCommand):
     """
@@ -248,12 +257,8 @@ class ExampleQueriesCommand(QleverCommand):
             # Remove OFFSET and LIMIT (after the last closing bracket).
             if args.remove_offset_and_limit or args.limit:
                 closing_bracket_idx = query.rfind("}")
-                regexes = [
-                    re.compile(r"OFFSET\s+\d+\s*", re.IGNORECASE),
-                    re.compile(r"LIMIT\s+\d+\s*", re.IGNORECASE),
-                ]
-                for regex in regexes:
-                    match = re.search(regex, query[closing_bracket_idx:])
+                for regex in [OFFSET_REGEX, LIMIT_REGEX]:
+                    match = regex.search(query[closing_bracket_idx:])
                     if match:
                         query = (
                             query[: closing_bracket_idx + match.start()]
@@ -267,8 +272,7 @@ class ExampleQueriesCommand(QleverCommand):
             # Count query.
             if args.download_or_count == "count":
                 # First find out if there is a FROM clause.
-                regex_from_clause = re.compile(r"\s*FROM\s+<[^>]+>\s*", re.IGNORECASE)
-                match_from_clause = re.search(regex_from_clause, query)
+                match_from_clause = FROM_CLAUSE_REGEX.search(query)
                 from_clause = " "
                 if match_from_clause:
                     from_clause = match_from_clause.group(0)
@@ -279,21 +283,19 @@ class ExampleQueriesCommand(QleverCommand):
                     )
                 # Now we can add the outer SELECT COUNT(*).
                 query = (
-                    re.sub(
-                        r"SELECT ",
+                    SELECT_REGEX.sub(
                         "SELECT (COUNT(*) AS ?qlever_count_)"
                         + from_clause
                         + "WHERE { SELECT ",
                         query,
                         count=1,
-                        flags=re.IGNORECASE,
                     )
                     + " }"
                 )
 
             # A bit of pretty-printing.
-            query = re.sub(r"\s+", " ", query)
-            query = re.sub(r"\s*\.\s*\}", " }", query)
+            query = WHITESPACE_REGEX.sub(" ", query)
+            query = DOT_BEFORE_CLOSING_BRACKET_REGEX.sub(" }", query)
             if args.show_query == "always":
                 log.info("")
                 self.pretty_print_query(query, args.show_prefixes)
@@ -323,14 +325,16 @@ class ExampleQueriesCommand(QleverCommand):
                 else:
                     error_msg = {
                         "short": f"HTTP code: {http_code}",
-                        "long": re.sub(r"\s+", " ", Path(result_file).read_text()),
+                        "long": WHITESPACE_REGEX.sub(
+                            " ", Path(result_file).read_text()
+                        ),
                     }
             except Exception as e:
                 if args.log_level == "DEBUG":
                     traceback.print_exc()
                 error_msg = {
                     "short": "Exception",
-                    "long": re.sub(r"\s+", " ", str(e)),
+                    "long": WHITESPACE_REGEX.sub(" ", str(e)),
                 }
 
             # Get result size (via the command line, in order to avoid loading
@@ -364,7 +368,7 @@ class ExampleQueriesCommand(QleverCommand):
                                 "short": "Malformed JSON",
                                 "long": "curl returned with code 200, "
                                 "but the JSON is malformed: "
-                                + re.sub(r"\s+", " ", str(e)),
+                                + WHITESPACE_REGEX.sub(" ", str(e)),
                             }
 
                 # CASE 2: Downloading the full result (TSV, CSV, Turtle, JSON).
@@ -390,7 +394,7 @@ class ExampleQueriesCommand(QleverCommand):
                         except Exception as e:
                             error_msg = {
                                 "short": "Malformed JSON",
-                                "long": re.sub(r"\s+", " ", str(e)),
+                                "long": WHITESPACE_REGEX.sub(" ", str(e)),
                             }
 
             # Remove the result file (unless in debug mode).
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import shlex
 import time
 import traceback
@@ -66,17 +67,14 @@ class QueryCommand(QleverCommand):
     def execute(self, args) -> bool:
         # When pinning to the cache, set `send=0` and request media type
         # `application/qlever-results+json` so that we get the result size.
-        # Also, we need to provide the access token.
+        # Also, we need to provide the access token. The result size is
+        # extracted from the JSON below (no need for `jq` and `numfmt`).
         if args.pin_to_cache:
             args.accept = "application/qlever-results+json"
             curl_cmd_additions = (
                 f" --data pinresult=true --data send=0"
                 f" --data access-token="
                 f"{shlex.quote(args.access_token)}"
-                f" | jq .resultsize | numfmt --grouping"
-                f" | xargs -I {{}} printf"
-                f' "Result pinned to cache,'
-                f' number of rows: {{}}\\n"'
             )
         else:
             curl_cmd_additions = ""
@@ -98,7 +96,22 @@ class QueryCommand(QleverCommand):
         # Launch query.
         try:
             start_time = time.time()
-            run_command(curl_cmd, show_output=True)
+            if args.pin_to_cache:
+                result = json.loads(run_command(curl_cmd, return_output=True))
+                # QLever reports errors (for example, a wrong access token)
+                # in the `exception` field of the JSON.
+                if "exception" in result:
+                    log.error(
+                        f"Pinning the result to the cache failed: "
+                        f"{result['exception']}"
+                    )
+                    return False
+                log.info(
+                    f"Result pinned to cache, number of rows: "
+                    f"{result['resultsize']:,}"
+                )
+            else:
+                run_command(curl_cmd, show_output=True)
             time_msecs = round(1000 * (time.time() - start_time))
             if not args.no_time and args.log_level != "NO_LOG":
                 log.info("")
@@ -1,12 +1,33 @@
 from __future__ import annotations
 
-import subprocess
-from os import environ
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 from qlever.command import QleverCommand
 from qlever.log import log
-from qlever.util import get_random_string
+from qlever.util import get_random_string, is_running_in_container
+
+# Regexes for the lines of the pre-configured Qleverfile that are modified
+# when copying it (the equivalent `sed` commands are shown to the user).
+ACCESS_TOKEN_REGEX = re.compile(r"^(ACCESS_TOKEN.*)$", re.MULTILINE)
+SYSTEM_REGEX = re.compile(r"^(SYSTEM[ \t]*=[ \t]*).*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=1)
+def get_qleverfile_names(qleverfiles_path: Path) -> tuple[str, ...]:
+    """
+    Return the names of the pre-configured Qleverfiles in the given directory
+    (the part after `Qleverfile.`). The Qleverfiles ship with the package and
+    do not change at runtime, so the directory is only scanned once.
+    """
+    prefix = "Qleverfile."
+    return tuple(
+        name[len(prefix):]
+        for name in os.listdir(qleverfiles_path)
+        if name.startswith(prefix) and len(name) > len(prefix)
+    )
 
 
 class SetupConfigCommand(QleverCommand):
@@ -16,9 +37,7 @@ class SetupConfigCommand(QleverCommand):
 
     def __init__(self):
         self.qleverfiles_path = Path(__file__).parent.parent / "Qleverfiles"
-        self.qleverfile_names = [
-            p.name.split(".")[1] for p in self.qleverfiles_path.glob("Qleverfile.*")
-        ]
+        self.qleverfile_names = get_qleverfile_names(self.qleverfiles_path)
 
     def description(self) -> str:
         return "Get a pre-configured Qleverfile"
@@ -39,7 +58,7 @@ class SetupConfigCommand(QleverCommand):
 
     def execute(self, args) -> bool:
         # Show a warning if `QLEVER_OVERRIDE_SYSTEM_NATIVE` is set.
-        qlever_is_running_in_container = environ.get("QLEVER_IS_RUNNING_IN_CONTAINER")
+        qlever_is_running_in_container = is_running_in_container()
         if qlever_is_running_in_container:
             log.warning(
                 "The environment variable `QLEVER_IS_RUNNING_IN_CONTAINER` is set, "
@@ -49,9 +68,10 @@ class SetupConfigCommand(QleverCommand):
             log.info("")
         # Construct the command line and show it.
         qleverfile_path = self.qleverfiles_path / f"Qleverfile.{args.config_name}"
+        access_token_suffix = get_random_string(12)
         setup_config_cmd = (
             f"cat {qleverfile_path}"
-            f" | sed -E 's/(^ACCESS_TOKEN.*)/\\1_{get_random_string(12)}/'"
+            f" | sed -E 's/(^ACCESS_TOKEN.*)/\\1_{access_token_suffix}/'"
         )
         if qlever_is_running_in_container:
             setup_config_cmd += (
@@ -63,8 +83,7 @@ class SetupConfigCommand(QleverCommand):
             return True
 
         # If there is already a Qleverfile in the current directory, exit.
-        qleverfile_path = Path("Qleverfile")
-        if qleverfile_path.exists():
+        if Path("Qleverfile").exists():
             log.error("`Qleverfile` already exists in current directory")
             log.info("")
             log.info(
@@ -74,15 +93,17 @@ class SetupConfigCommand(QleverCommand):
             )
             return False
 
-        # Copy the Qleverfile to the current directory.
+        # Copy the Qleverfile to the current directory. This does the same as
+        # `setup_config_cmd` above, but in Python instead of via a pipeline of
+        # three processes.
         try:
-            subprocess.run(
-                setup_config_cmd,
-                shell=True,
-                check=True,
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.DEVNULL,
+            qleverfile = qleverfile_path.read_text(encoding="utf-8")
+            qleverfile = ACCESS_TOKEN_REGEX.sub(
+                rf"\g<1>_{access_token_suffix}", qleverfile
             )
+            if qlever_is_running_in_container:
+                qleverfile = SYSTEM_REGEX.sub(r"\g<1>native", qleverfile)
+            Path("Qleverfile").write_text(qleverfile, encoding="utf-8")
         except Exception as e:
             log.error(
                 f'Could not copy "{qleverfile_path}"' f" to current directory: {e}"
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import os
+import shlex
+import shutil
 import subprocess
+import sys
+import threading
 import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from qlever.command import QleverCommand
 from qlever.commands.cache_stats import CacheStatsCommand
@@ -10,34 +18,76 @@ from qlever.commands.stop import StopCommand
 from qlever.commands.warmup import WarmupCommand
 from qlever.containerize import Containerize
 from qlever.log import log
-from qlever.util import is_qlever_server_alive, run_command
-
-
-# Construct the command line based on the config file.
-def construct_command_line(args) -> str:
-    start_cmd = (
-        f"{args.server_binary}"
-        f" -i {args.name}"
-        f" -j {args.num_threads}"
-        f" -p {args.port}"
-        f" -m {args.memory_for_queries}"
-        f" -c {args.cache_max_size}"
-        f" -e {args.cache_max_size_single_entry}"
-        f" -k {args.cache_max_num_entries}"
-    )
+from qlever.util import (is_port_open, is_qlever_server_alive,
+                         probe_qlever_server, run_command)
+
+# The line in the server log that says that the server accepts requests.
+SERVER_READY_MARKER = "The server is ready"
+
+
+# Construct the arguments of the server command based on the config file.
+def construct_command_argv(args) -> list[str]:
+    start_argv = [
+        f"{args.server_binary}",
+        "-i", f"{args.name}",
+        "-j", f"{args.num_threads}",
+        "-p", f"{args.port}",
+        "-m", f"{args.memory_for_queries}",
+        "-c", f"{args.cache_max_size}",
+        "-e", f"{args.cache_max_size_single_entry}",
+        "-k", f"{args.cache_max_num_entries}",
+    ]
 
     if args.timeout:
-        start_cmd += f" -s {args.timeout}"
+        start_argv += ["-s", f"{args.timeout}"]
     if args.access_token:
-        start_cmd += f" -a {args.access_token}"
+        start_argv += ["-a", f"{args.access_token}"]
     if args.only_pso_and_pos_permutations:
-        start_cmd += " --only-pso-and-pos-permutations"
+        start_argv.append("--only-pso-and-pos-permutations")
     if not args.use_patterns:
-        start_cmd += " --no-patterns"
+        start_argv.append("--no-patterns")
     if args.use_text_index == "yes":
-        start_cmd += " -t"
-    start_cmd += f" > {args.name}.server-log.txt 2>&1"
-    return start_cmd
+        start_argv.append("-t")
+    return start_argv
+
+
+# Construct the command line based on the config file.
+def construct_command_line(args) -> str:
+    return " ".join(
+        construct_command_argv(args)
+        + [f"> {args.name}.server-log.txt 2>&1"]
+    )
+
+
+# Start the server natively in the background, with its output redirected to
+# the given log file. This is what `nohup ... > log 2>&1 &` does, but without
+# a shell in between: the server gets its own session, so that it keeps
+# running when the terminal is closed.
+def start_server_natively(start_argv, log_file) -> subprocess.Popen:
+    with open(log_file, "wb") as log_fd:
+        return subprocess.Popen(
+            start_argv,
+            stdin=subprocess.DEVNULL,
+            stdout=log_fd,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+
+# Wait until nothing accepts connections on the given port anymore, polling
+# with exponential backoff. Return `False` if the port is still open after
+# `timeout` seconds.
+def wait_until_port_is_closed(
+    port, timeout=30.0, initial_delay=0.05, max_delay=1.0
+) -> bool:
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while is_port_open("localhost", port):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(max_delay, delay * 1.5)
+    return True
 
 
 # Kill existing server on the same port. Trust that StopCommand() works?
@@ -48,6 +98,15 @@ def kill_existing_server(args) -> bool:
     if not StopCommand().execute(args):
         log.error("Stopping the existing server failed")
         return False
+    # The kill signal is delivered right away, but a large server can take a
+    # while to exit and release its port. Until then, the port would look as
+    # if it was used by another process.
+    if not wait_until_port_is_closed(args.port):
+        log.error(
+            f"Port {args.port} is still in use after stopping the existing "
+            f"server"
+        )
+        return False
     log.info("")
     return True
 
@@ -69,8 +128,20 @@ def run_command_in_container(args, start_cmd) -> str:
     return start_cmd
 
 
-# When running natively, check if the binary exists and works.
-def check_binary(binary) -> bool:
+# When running natively, check if the binary exists and is executable. This
+# only needs a lookup in the file system. If `run_help` is `True`, also run
+# the binary with `--help` to check that it actually works (for example,
+# that all shared libraries are found).
+def check_binary(binary, run_help=False) -> bool:
+    if shutil.which(binary) is None:
+        log.error(
+            f'Binary "{binary}" not found or not executable, '
+            f"set `--server-binary` to a different binary or "
+            f"set `--system to a container system`"
+        )
+        return False
+    if not run_help:
+        return True
     try:
         run_command(f"{binary} --help")
         return True
@@ -85,38 +156,146 @@ def check_binary(binary) -> bool:
         return False
 
 
-# Set the access token if specified. Try to set the index description
-def setting_index_description(access_arg, port, desc) -> bool:
-    curl_cmd = (
-        f"curl -Gs http://localhost:{port}/api"
-        f' --data-urlencode "index-description={desc}"'
-        f" {access_arg} > /dev/null"
-    )
-    log.debug(curl_cmd)
+# Open a connection to the server on the given port. The connection is
+# kept alive, so that it can be used for several API requests in a row.
+def open_api_connection(port):
+    # Imported here because `http.client` is expensive to import, and only
+    # needed when actually starting a server.
+    import http.client
+
+    return http.client.HTTPConnection("localhost", port, timeout=30)
+
+
+# Send a GET request with the given parameters to the `/api` endpoint of the
+# server, over the given connection. This is what `curl -Gs ...
+# --data-urlencode ...` would do, but without starting a `curl` process (and
+# without the quoting pitfalls of the shell). Raise an exception if the
+# request fails.
+def send_api_request(connection, params: dict[str, str]) -> None:
+    path = f"/api?{urllib.parse.urlencode(params)}"
+    url = f"http://{connection.host}:{connection.port}{path}"
+    log.debug(f"curl -Gs {shlex.quote(url)}")
+    connection.request("GET", path)
+    response = connection.getresponse()
+    response.read()
+    if not 200 <= response.status < 300:
+        raise Exception(f"HTTP status {response.status} {response.reason}")
+
+
+# Set the index description (with the access token, if specified).
+def setting_index_description(connection, desc, access_token) -> bool:
+    params = {"index-description": desc}
+    if access_token:
+        params["access-token"] = access_token
     try:
-        run_command(curl_cmd)
+        send_api_request(connection, params)
     except Exception as e:
         log.error(f"Setting the index description failed ({e})")
         return False
     return True
 
 
-# Set the access token if specified. Try to set the text description
-def setting_text_description(access_arg, port, text_desc) -> bool:
-    curl_cmd = (
-        f"curl -Gs http://localhost:{port}/api"
-        f' --data-urlencode "text-description={text_desc}"'
-        f" {access_arg} > /dev/null"
-    )
-    log.debug(curl_cmd)
+# Set the text description (with the access token, if specified).
+def setting_text_description(connection, text_desc, access_token) -> bool:
+    params = {"text-description": text_desc}
+    if access_token:
+        params["access-token"] = access_token
     try:
-        run_command(curl_cmd)
+        send_api_request(connection, params)
     except Exception as e:
         log.error(f"Setting the text description failed ({e})")
         return False
     return True
 
 
+# Set the index and the text description (those that are specified). If both
+# are specified, try to set them with a single request first, and only if
+# that fails, set them one by one (for the error messages).
+def setting_descriptions(connection, desc, text_desc, access_token) -> bool:
+    if desc and text_desc:
+        params = {"index-description": desc, "text-description": text_desc}
+        if access_token:
+            params["access-token"] = access_token
+        try:
+            send_api_request(connection, params)
+            return True
+        except Exception as e:
+            log.debug(f"Setting both descriptions at once failed ({e})")
+    if desc and not setting_index_description(connection, desc, access_token):
+        return False
+    if text_desc and not setting_text_description(
+        connection, text_desc, access_token
+    ):
+        return False
+    return True
+
+
+# Wait until the server at the given endpoint is alive. Poll with exponential
+# backoff, so that a server that is up quickly is also detected quickly, while
+# a server that takes long to start is not probed more than once per second.
+# If a `ready_event` is given, the next probe happens as soon as it is set
+# (see `LogTailer`), without waiting for the rest of the delay. If a server
+# `process` is given, stop waiting as soon as it has exited. Return `True` if
+# the server is alive, `False` if the process exited before.
+def wait_until_server_is_alive(
+    endpoint_url,
+    initial_delay=0.05,
+    max_delay=1.0,
+    ready_event=None,
+    process=None,
+) -> bool:
+    delay = initial_delay
+    while not is_qlever_server_alive(endpoint_url):
+        if process is not None and process.poll() is not None:
+            return False
+        if ready_event is None or ready_event.is_set():
+            time.sleep(delay)
+        else:
+            ready_event.wait(delay)
+        delay = min(max_delay, delay * 1.5)
+    return True
+
+
+# Follow the given log file in a background thread and print each line that
+# is written to it, like `tail -f`, until `stop` is called. Unlike `tail -f`
+# in a subprocess, this needs no extra processes and stops cleanly. The
+# `ready` event is set when a line contains the given `ready_marker`.
+class LogTailer(threading.Thread):
+    def __init__(self, log_file, poll_interval=0.05, ready_marker=None):
+        super().__init__(daemon=True)
+        self.log_file = Path(log_file)
+        self.poll_interval = poll_interval
+        self.ready_marker = ready_marker
+        self.ready = threading.Event()
+        self.stop_event = threading.Event()
+
+    def run(self):
+        # The log file may not exist yet when the server was just launched.
+        while not self.log_file.exists():
+            if self.stop_event.wait(self.poll_interval):
+                return
+        with open(self.log_file, errors="replace") as log_file:
+            while True:
+                line = log_file.readline()
+                if line:
+                    sys.stdout.write(line)
+                    sys.stdout.flush()
+                    if self.ready_marker and self.ready_marker in line:
+                        self.ready.set()
+                    continue
+                # If the file was truncated (by the redirection of the
+                # server output), start again from the beginning.
+                if self.log_file.stat().st_size < log_file.tell():
+                    log_file.seek(0)
+                    continue
+                if self.stop_event.wait(self.poll_interval):
+                    break
+
+    def stop(self):
+        self.stop_event.set()
+        self.join()
+
+
 class StartCommand(QleverCommand):
     """
     Class for executing the `start` command.
@@ -163,6 +342,13 @@ class StartCommand(QleverCommand):
         #                        help="If a QLever server is already running "
         #                             "with the same name, kill it before "
         #                             "starting a new server")
+        subparser.add_argument(
+            "--check-server-binary",
+            action="store_true",
+            default=False,
+            help="When running natively, also run the server binary with "
+            "`--help` before starting it, to check that it works",
+        )
         subparser.add_argument(
             "--kill-existing-with-same-port",
             action="store_true",
@@ -190,18 +376,26 @@ class StartCommand(QleverCommand):
             log.info("")
 
         # Kill existing server on the same port if so desired.
-        if args.kill_existing_with_same_port:
-            if args.kill_existing_with_same_port and not kill_existing_server(
-                args
-            ):
-                return False
+        if args.kill_existing_with_same_port and not kill_existing_server(
+            args
+        ):
+            return False
+
+        # When running natively, the server is started without a shell, so
+        # expand `~` and environment variables in the binary ourselves (as
+        # the shell did before, e.g. for `SERVER_BINARY = ~/qlever/...`).
+        if args.system == "native":
+            args.server_binary = os.path.expandvars(
+                os.path.expanduser(args.server_binary)
+            )
 
         # Construct the command line based on the config file.
         start_cmd = construct_command_line(args)
 
         # Run the command in a container (if so desired). Otherwise run with
         # `nohup` so that it keeps running after the shell is closed.
-        if args.system in Containerize.supported_systems():
+        use_container = args.system in Containerize.supported_systems()
+        if use_container:
             start_cmd = run_command_in_container(args, start_cmd)
         else:
             start_cmd = f"nohup {start_cmd} &"
@@ -211,14 +405,42 @@ class StartCommand(QleverCommand):
         if args.show:
             return True
 
-        # When running natively, check if the binary exists and works.
-        if args.system == "native":
-            if not check_binary(args.server_binary):
+        # Remove an already existing container (if so desired). This must
+        # happen before we check if a QLever server is already running on
+        # this port, since that server may run in this very container (and
+        # `kill_existing_server` does not stop containers).
+        if use_container and args.kill_existing_with_same_port:
+            try:
+                run_command(f"{args.system} rm -f {args.server_container}")
+            except Exception as e:
+                log.error(f"Removing existing container failed: {e}")
                 return False
 
-        # Check if a QLever server is already running on this port.
+        # The following two preflight checks are independent of each other,
+        # so run them concurrently: when running natively, check if the
+        # binary exists (and works, if so desired); and check if a QLever
+        # server is already running on this port. The results are evaluated
+        # in this order below.
         endpoint_url = f"http://localhost:{args.port}"
-        if is_qlever_server_alive(endpoint_url):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            binary_ok = (
+                executor.submit(
+                    check_binary,
+                    args.server_binary,
+                    run_help=args.check_server_binary,
+                )
+                if args.system == "native"
+                else None
+            )
+            server_probe = executor.submit(probe_qlever_server, endpoint_url)
+
+        # When running natively, the binary must exist and work.
+        if binary_ok and not binary_ok.result():
+            return False
+
+        # Check if a QLever server is already running on this port.
+        port_is_open, server_is_alive = server_probe.result()
+        if server_is_alive:
             log.error(f"QLever server already running on {endpoint_url}")
             log.info("")
             log.info(
@@ -233,59 +455,69 @@ class StartCommand(QleverCommand):
             StatusCommand().execute(args)
             return False
 
-        # Remove already existing container.
-        if (
-            args.system in Containerize.supported_systems()
-            and args.kill_existing_with_same_port
-        ):
-            try:
-                run_command(f"{args.system} rm -f {args.server_container}")
-            except Exception as e:
-                log.error(f"Removing existing container failed: {e}")
-                return False
-
-        # Check if another process is already listening.
-        # if self.net_connections_enabled:
-        #     if port in [conn.laddr.port for conn
-        #                 in psutil.net_connections()]:
-        #         log.error(f"Port {port} is already in use by another process"
-        #                   f" (use `lsof -i :{port}` to find out which one)")
-        #         return False
+        # Check if another process is already listening on the port (there is
+        # no QLever server there, see above). Otherwise the server would fail
+        # to start and we would wait for it forever.
+        if port_is_open:
+            log.error(
+                f"Port {args.port} is already in use by another process"
+                f" (use `lsof -i :{args.port}` to find out which one)"
+            )
+            return False
 
-        # Execute the command line.
+        # Execute the command line. When running natively, start the server
+        # process directly instead of via `nohup` in a shell.
+        server_process = None
         try:
-            run_command(start_cmd)
+            if use_container:
+                run_command(start_cmd)
+            else:
+                server_process = start_server_natively(
+                    construct_command_argv(args),
+                    f"{args.name}.server-log.txt",
+                )
         except Exception as e:
             log.error(f"Starting the QLever server failed ({e})")
             return False
 
-        # Tail the server log until the server is ready (note that the `exec`
-        # is important to make sure that the tail process is killed and not
-        # just the bash process).
+        # Follow the server log until the server is ready.
         log.info(
             f"Follow {args.name}.server-log.txt until the server is ready"
             f" (Ctrl-C stops following the log, but not the server)"
         )
         log.info("")
-        tail_cmd = f"exec tail -f {args.name}.server-log.txt"
-        tail_proc = subprocess.Popen(tail_cmd, shell=True)
-        while not is_qlever_server_alive(endpoint_url):
-            time.sleep(1)
-
-        # Set the access token if specified.
-        access_arg = f'--data-urlencode "access-token={args.access_token}"'
-        if args.description and not setting_index_description(
-            access_arg, args.port, args.description
+        log_tailer = LogTailer(
+            f"{args.name}.server-log.txt", ready_marker=SERVER_READY_MARKER
+        )
+        log_tailer.start()
+        if not wait_until_server_is_alive(
+            endpoint_url, ready_event=log_tailer.ready, process=server_process
         ):
+            log_tailer.stop()
+            log.info("")
+            log.error(
+                f"The QLever server exited with code "
+                f"{server_process.returncode} before it was ready, see "
+                f"{args.name}.server-log.txt for what went wrong"
+            )
             return False
 
-        if args.text_description and not setting_text_description(
-            access_arg, args.port, args.text_description
-        ):
-            return False
+        # Set the index and text description (if specified).
+        connection = open_api_connection(args.port)
+        try:
+            descriptions_set = setting_descriptions(
+                connection,
+                args.description,
+                args.text_description,
+                args.access_token,
+            )
+        finally:
+            connection.close()
 
-        # Kill the tail process. NOTE: `tail_proc.kill()` does not work.
-        tail_proc.terminate()
+        # Stop following the server log.
+        log_tailer.stop()
+        if not descriptions_set:
+            return False
 
         # Execute the warmup command.
         if args.warmup_cmd and not args.no_warmup:
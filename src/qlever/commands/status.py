@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import psutil
+import re
 
 from qlever.command import QleverCommand
-from qlever.util import show_process_info
+from qlever.util import find_processes, show_process_info
 
 
 class StatusCommand(QleverCommand):
@@ -39,9 +39,10 @@ class StatusCommand(QleverCommand):
 
         # Show the results as a table.
         num_processes_found = 0
-        for proc in psutil.process_iter():
+        cmdline_pattern = re.compile(args.cmdline_regex)
+        for proc, _, _ in find_processes(cmdline_pattern):
             show_heading = num_processes_found == 0
-            process_shown = show_process_info(proc, args.cmdline_regex,
+            process_shown = show_process_info(proc, cmdline_pattern,
                                               show_heading=show_heading)
             if process_shown:
                 num_processes_found += 1
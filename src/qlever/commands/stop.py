@@ -1,11 +1,9 @@
 from __future__ import annotations
-import re
-import psutil
 from qlever.command import QleverCommand
 from qlever.commands.status import StatusCommand
 from qlever.containerize import Containerize
 from qlever.log import log
-from qlever.util import show_process_info
+from qlever.util import find_processes, show_process_info
 
 # try to kill the given process, return true iff it was killed successfully.
 # the process_info is used for logging.
@@ -26,14 +24,12 @@ def stop_process(proc, pinfo):
 # try to stop and remove container. return True iff it was stopped
 # successfully. Gives log info accordingly.
 def stop_container(server_container):
-    for container_system in Containerize.supported_systems():
-        if Containerize.stop_and_remove_container(
-                container_system, server_container):
-            log.info(f"{container_system.capitalize()} container with "
-                     f"name \"{server_container}\" stopped "
-                     f" and removed")
-            return True
-    return False
+    stopped = Containerize.stop_and_remove_containers(server_container)
+    for container_system in stopped:
+        log.info(f"{container_system.capitalize()} container with "
+                 f"name \"{server_container}\" stopped "
+                 f" and removed")
+    return len(stopped) > 0
 
 
 class StopCommand(QleverCommand):
@@ -85,20 +81,11 @@ class StopCommand(QleverCommand):
         # Check if there is a process running on the server port using psutil.
         # NOTE: On MacOS, some of the proc's returned by psutil.process_iter()
         # no longer exist when we try to access them, so we just skip them.
-        for proc in psutil.process_iter():
-            try:
-                pinfo = proc.as_dict(
-                    attrs=['pid', 'username', 'create_time',
-                           'memory_info', 'cmdline'])
-                cmdline = " ".join(pinfo['cmdline'])
-            except Exception as e:
-                log.debug(f"Error getting process info: {e}")
-                return False
-            if re.search(cmdline_regex, cmdline):
-                log.info(f"Found process {pinfo['pid']} from user "
-                         f"{pinfo['username']} with command line: {cmdline}")
-                log.info("")
-                return stop_process(proc, pinfo)
+        for proc, pinfo, cmdline in find_processes(cmdline_regex):
+            log.info(f"Found process {pinfo['pid']} from user "
+                     f"{pinfo['username']} with command line: {cmdline}")
+            log.info("")
+            return stop_process(proc, pinfo)
 
         # If no matching process found, show a message and the output of the
         # status command.
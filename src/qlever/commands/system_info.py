@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import os
 import platform
-from importlib.metadata import version
+import shutil
+from functools import lru_cache
 from pathlib import Path
 
-import psutil
-
 from qlever.command import QleverCommand
 from qlever.containerize import Containerize
 from qlever.log import log
-from qlever.util import format_size, run_command
+from qlever.util import format_size, get_qlever_version, run_command
 
 
 def show_heading(text: str) -> str:
@@ -18,26 +18,63 @@ def show_heading(text: str) -> str:
     log.info("")
 
 
+@lru_cache(maxsize=1)
+def get_partitions_by_mountpoint() -> dict:
+    """
+    Returns the physical partitions, keyed by mountpoint. This is computed
+    only once, because `psutil.disk_partitions` can be slow (for example,
+    with network file systems), and the partitions do not change while the
+    command runs.
+    """
+    import psutil
+
+    return {
+        partition.mountpoint: partition
+        for partition in psutil.disk_partitions(all=False)
+    }
+
+
 def get_partition(dir: Path):
     """
     Returns the partition on which `dir` resides. May return None.
     """
-    # The first partition that whose mountpoint is a parent of `dir` is
-    # returned. Sort the partitions by the length of the mountpoint to ensure
-    # that the result is correct. Assume there are partitions with mountpoint
-    # `/` and `/home`. This ensures that `/home/foo` is detected as being in
-    # the partition with mountpoint `/home`.
-    partitions = sorted(
-        psutil.disk_partitions(),
-        key=lambda part: len(part.mountpoint),
-        reverse=True,
-    )
-    for partition in partitions:
-        if dir.is_relative_to(partition.mountpoint):
+    # The partition with the longest mountpoint that is `dir` or one of its
+    # parents is returned. Assume there are partitions with mountpoint `/`
+    # and `/home`. Then `/home/foo` is detected as being in the partition
+    # with mountpoint `/home`, because `/home` is looked up before `/`.
+    partitions = get_partitions_by_mountpoint()
+    for path in (dir, *dir.parents):
+        partition = partitions.get(str(path))
+        if partition is not None:
             return partition
     return None
 
 
+def get_user_info() -> str:
+    """
+    Returns the user and groups of the current process in the same format as
+    the output of `id`, but without running `id`. Only works on Unix.
+    """
+    # Imported here because these modules do not exist on Windows.
+    import grp
+    import pwd
+
+    def with_name(id: int, get_name) -> str:
+        try:
+            return f"{id}({get_name(id)})"
+        except KeyError:
+            return f"{id}"
+
+    def group_name(gid: int) -> str:
+        return grp.getgrgid(gid).gr_name
+
+    uid, gid = os.geteuid(), os.getegid()
+    user = with_name(uid, lambda uid: pwd.getpwuid(uid).pw_name)
+    gids = [gid] + [g for g in dict.fromkeys(os.getgroups()) if g != gid]
+    groups = ",".join(with_name(g, group_name) for g in gids)
+    return f"uid={user} gid={with_name(gid, group_name)} groups={groups}"
+
+
 class SystemInfoCommand(QleverCommand):
     def __init__(self):
         pass
@@ -55,6 +92,10 @@ class SystemInfoCommand(QleverCommand):
         pass
 
     def execute(self, args) -> bool:
+        # Imported here because `psutil` is expensive to import, and only
+        # needed when this command is actually run.
+        import psutil
+
         # Say what the command is doing.
         self.show("Show system information and Qleverfile", only_show=args.show)
         if args.show:
@@ -62,38 +103,44 @@ class SystemInfoCommand(QleverCommand):
 
         # Show system information.
         show_heading("System Information")
-        system = platform.system()
+        uname = platform.uname()
+        system = uname.system
         is_linux = system == "Linux"
         is_mac = system == "Darwin"
         is_windows = system == "Windows"
         if is_windows:
             log.warn("Only limited information is gathered on Windows.")
-        log.info(f"Version: {version('qlever')} (qlever --version)")
+        log.info(f"Version: {get_qlever_version()} (qlever --version)")
         if is_linux:
             info = platform.freedesktop_os_release()
-            log.info(f"OS: {platform.system()} ({info['PRETTY_NAME']})")
+            log.info(f"OS: {system} ({info['PRETTY_NAME']})")
         else:
-            log.info(f"OS: {platform.system()}")
-        log.info(f"Arch: {platform.machine()}")
-        log.info(f"Host: {platform.node()}")
-        psutil.virtual_memory().total / (1000**3)
-        memory_total = psutil.virtual_memory().total / (1024.0**3)
-        memory_available = psutil.virtual_memory().available / (1024.0**3)
+            log.info(f"OS: {system}")
+        log.info(f"Arch: {uname.machine}")
+        log.info(f"Host: {uname.node}")
+        virtual_memory = psutil.virtual_memory()
+        memory_total = virtual_memory.total / (1024.0**3)
+        memory_available = virtual_memory.available / (1024.0**3)
         log.info(
             f"RAM: {memory_total:.1f} GB total, " f"{memory_available:.1f} GB available"
         )
         num_cores = psutil.cpu_count(logical=False)
         num_threads = psutil.cpu_count(logical=True)
-        cpu_freq = psutil.cpu_freq().max / 1000
-        log.info(
-            f"CPU: {num_cores} Cores, " f"{num_threads} Threads @ {cpu_freq:.2f} GHz"
-        )
+        cpu_info = f"CPU: {num_cores} Cores, {num_threads} Threads"
+        # The frequency is not available on all systems, and the maximum
+        # frequency is reported as 0 on some (e.g., in VMs).
+        cpu_freq = psutil.cpu_freq()
+        if cpu_freq is not None:
+            ghz = (cpu_freq.max or cpu_freq.current) / 1000
+            if ghz:
+                cpu_info += f" @ {ghz:.2f} GHz"
+        log.info(cpu_info)
 
         cwd = Path.cwd()
         log.info(f"CWD: {cwd}")
         # Free and total size of the partition on which the current working
         # directory resides.
-        disk_usage = psutil.disk_usage(str(cwd))
+        disk_usage = shutil.disk_usage(cwd)
         partition = get_partition(cwd)
         partition_description = f"{partition.device} @ {partition.mountpoint}"
         fs_type = partition.fstype
@@ -105,7 +152,7 @@ class SystemInfoCommand(QleverCommand):
         )
         # User/Group on host and in container
         if is_linux or is_mac:
-            user_info = run_command("id", return_output=True).strip()
+            user_info = get_user_info()
             log.info(f"User and group on host: {user_info}")
         elif is_windows:
             user_info = run_command("whoami /all", return_output=True).strip()
@@ -118,9 +165,9 @@ class SystemInfoCommand(QleverCommand):
         log.info("")
         show_heading("Contents of Qleverfile")
         qleverfile = cwd / "Qleverfile"
-        if qleverfile.exists():
+        try:
             # TODO: output the effective qlever file using primites from #57
-            log.info(qleverfile.read_text())
-        else:
+            log.info(qleverfile.read_bytes().decode("utf-8", errors="replace"))
+        except FileNotFoundError:
             log.info("No Qleverfile found")
         return True
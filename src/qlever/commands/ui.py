@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+import shlex
 import subprocess
-from os import environ
 
 from qlever.command import QleverCommand
 from qlever.containerize import Containerize
 from qlever.log import log
-from qlever.util import is_port_used
+from qlever.util import is_port_used, is_running_in_container
 
 
 class UiCommand(QleverCommand):
@@ -31,11 +31,17 @@ class UiCommand(QleverCommand):
         }
 
     def additional_arguments(self, subparser) -> None:
-        pass
+        subparser.add_argument(
+            "--pull",
+            choices=["always", "missing", "never"],
+            default="always",
+            help="When to pull the UI image: always (default), only if it is "
+            "missing locally, or never",
+        )
 
     def execute(self, args) -> bool:
         # If QLEVER_OVERRIDE_DISABLE_UI is set, this command is disabled.
-        qlever_is_running_in_container = environ.get("QLEVER_IS_RUNNING_IN_CONTAINER")
+        qlever_is_running_in_container = is_running_in_container()
         if qlever_is_running_in_container:
             log.error(
                 "The environment variable `QLEVER_OVERRIDE_DISABLE_UI` is set, "
@@ -66,18 +72,40 @@ class UiCommand(QleverCommand):
             f'bash -c "python manage.py configure '
             f'{args.ui_config} {server_url}"'
         )
-        self.show(
-            "\n".join(["Stop running containers", pull_cmd, run_cmd, exec_cmd]),
-            only_show=args.show,
-        )
+        show_cmds = ["Stop running containers", run_cmd, exec_cmd]
+        if args.pull == "always":
+            show_cmds.insert(1, pull_cmd)
+        elif args.pull == "missing":
+            show_cmds.insert(
+                1,
+                f"{args.ui_system} image inspect {args.ui_image} "
+                f"> /dev/null 2>&1 || {pull_cmd}",
+            )
+        self.show("\n".join(show_cmds), only_show=args.show)
         if qlever_is_running_in_container:
             return False
         if args.show:
             return True
 
+        # Pull the image in the background. This is network-bound and usually
+        # the slowest step, so we stop running containers and check the port
+        # meanwhile. With `--pull missing`, we only pull if there is no local
+        # image, which saves the registry round trip.
+        pull_process = None
+        if args.pull == "always" or (
+            args.pull == "missing"
+            and not Containerize.image_exists(args.ui_system, args.ui_image)
+        ):
+            try:
+                pull_process = subprocess.Popen(
+                    shlex.split(pull_cmd), stdout=subprocess.DEVNULL
+                )
+            except OSError as e:
+                log.error(f"Failed to run \"{pull_cmd}\" ({e})")
+                return False
+
         # Stop running containers.
-        for container_system in Containerize.supported_systems():
-            Containerize.stop_and_remove_container(container_system, args.ui_container)
+        Containerize.stop_and_remove_containers(args.ui_container)
 
         # Check if the UI port is already being used.
         if is_port_used(args.ui_port):
@@ -86,11 +114,19 @@ class UiCommand(QleverCommand):
             )
 
         # Try to start the QLever UI.
+        if pull_process is not None and pull_process.wait() != 0:
+            log.warning(
+                f"Pulling the image {args.ui_image} failed, trying to start "
+                f"the QLever UI with the local image"
+            )
+        # The commands are run without a shell, so that only the shell inside
+        # the container is started for `exec_cmd`.
         try:
-            subprocess.run(pull_cmd, shell=True, stdout=subprocess.DEVNULL)
-            subprocess.run(run_cmd, shell=True, stdout=subprocess.DEVNULL)
-            subprocess.run(exec_cmd, shell=True, stdout=subprocess.DEVNULL)
-        except subprocess.CalledProcessError as e:
+            for cmd in [run_cmd, exec_cmd]:
+                subprocess.run(
+                    shlex.split(cmd), stdout=subprocess.DEVNULL, check=True
+                )
+        except (subprocess.CalledProcessError, OSError) as e:
             log.error(f"Failed to start the QLever UI ({e})")
             return False
 
@@ -3,7 +3,6 @@ from __future__ import annotations
 import argparse
 import os
 import traceback
-from importlib.metadata import version
 from pathlib import Path
 
 import argcomplete
@@ -12,6 +11,7 @@ from termcolor import colored
 from qlever import command_objects, script_name
 from qlever.log import log, log_levels
 from qlever.qleverfile import Qleverfile
+from qlever.util import get_qlever_version
 
 
 # Simple exception class for configuration errors (the class need not do
@@ -180,7 +180,7 @@ class QleverConfig:
                                     "it's all you need to work with QLever",
                                     attrs=["bold"]))
         parser.add_argument("--version", action="version",
-                            version=f"%(prog)s {version('qlever')}")
+                            version=f"%(prog)s {get_qlever_version()}")
         add_qleverfile_option(parser)
         subparsers = parser.add_subparsers(dest='command')
         subparsers.required = True
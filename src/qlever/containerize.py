@@ -5,13 +5,20 @@
 from __future__ import annotations
 
 import shlex
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 from qlever.log import log
 from qlever.util import run_command, get_random_string
 
 
+# The container systems that `Containerize` supports.
+SUPPORTED_CONTAINER_SYSTEMS = ("docker", "podman")
+
+
 class ContainerizeException(Exception):
     pass
 
@@ -23,12 +30,13 @@ class Containerize:
     """
 
     @staticmethod
-    def supported_systems() -> list[str]:
+    def supported_systems() -> tuple[str, ...]:
         """
-        Return a list of the supported container systems. Make sure that they
-        are all indeed supported by `containerize_command` below.
+        Return the supported container systems. Make sure that they are all
+        indeed supported by `containerize_command` below. This is a constant,
+        so it is the same (immutable) tuple for every call.
         """
-        return ["docker", "podman"]
+        return SUPPORTED_CONTAINER_SYSTEMS
 
     @staticmethod
     def containerize_command(
@@ -99,6 +107,34 @@ class Containerize:
         )
         return container_name in containers
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def is_installed(container_system: str) -> bool:
+        """
+        Return `True` if the binary of the given container system is found in
+        the `PATH`. The result is cached, so the `PATH` is searched at most
+        once per container system.
+        """
+        return shutil.which(container_system) is not None
+
+    @staticmethod
+    def image_exists(container_system: str, image_name: str) -> bool:
+        """
+        Return `True` if the image with the given name is available locally
+        for the given system, `False` otherwise. This does not contact the
+        registry.
+        """
+        try:
+            result = subprocess.run(
+                [container_system, "image", "inspect", image_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            log.debug(f'Error inspecting image "{image_name}": {e}')
+            return False
+        return result.returncode == 0
+
     @staticmethod
     def stop_and_remove_container(container_system: str, container_name: str) -> bool:
         """
@@ -114,6 +150,11 @@ class Containerize:
                 f" (must be one of {Containerize.supported_systems()})"
             )
 
+        # If the container system is not installed, there is no container
+        # to stop, and we can save ourselves the shell and the two commands.
+        if not Containerize.is_installed(container_system):
+            return False
+
         # Construct the command that stops the container.
         stop_cmd = (
             f"{container_system} stop {container_name} && "
@@ -134,6 +175,29 @@ class Containerize:
             log.debug(f'Error running "{stop_cmd}": {e}')
             return False
 
+    @staticmethod
+    def stop_and_remove_containers(container_name: str) -> list[str]:
+        """
+        Stop and remove the container with the given name for all supported
+        container systems, and return the systems for which a container was
+        found and stopped. The systems are probed concurrently, since each
+        probe starts its own processes.
+        """
+        systems = Containerize.supported_systems()
+        with ThreadPoolExecutor(max_workers=len(systems)) as executor:
+            stopped = list(
+                executor.map(
+                    lambda system: Containerize.stop_and_remove_container(
+                        system, container_name
+                    ),
+                    systems,
+                )
+            )
+        return [
+            system for system, was_stopped in zip(systems, stopped)
+            if was_stopped
+        ]
+
     @staticmethod
     def run_in_container(cmd: str, args) -> Optional[str]:
         """
@@ -145,7 +209,7 @@ class Containerize:
             run_cmd = Containerize().containerize_command(
                 cmd,
                 args.system,
-                'run --rm -it --entrypoint "" ',
+                'run --rm -i --entrypoint "" ',
                 args.image,
                 args.server_container,
                 volumes=[("$(pwd)", "/index")],
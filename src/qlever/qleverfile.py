@@ -253,7 +253,7 @@ class Qleverfile:
         runtime_args["system"] = arg(
             "--system",
             type=str,
-            choices=Containerize.supported_systems() + ["native"],
+            choices=[*Containerize.supported_systems(), "native"],
             default="docker",
             help=(
                 "Whether to run commands like `index` or `start` "
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import errno
+import fnmatch
+import os
 import re
 import secrets
 import shlex
@@ -9,8 +10,11 @@ import socket
 import string
 import subprocess
 from datetime import date, datetime
+from functools import lru_cache
+from importlib.metadata import version
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlsplit
 
 from qlever.log import log
 
@@ -124,11 +128,34 @@ def run_curl_command(
     return result.stdout
 
 
-def is_qlever_server_alive(endpoint_url: str) -> bool:
+def is_port_open(host: str, port: int, timeout: float = 0.2) -> bool:
     """
-    Helper function that checks if a QLever server is running on the given
-    endpoint. Return `True` if the server is alive, `False` otherwise.
+    Helper function that checks if some process accepts TCP connections on
+    the given host and port. This takes a single `connect`, and a refused
+    connection is detected right away.
     """
+    try:
+        socket.create_connection((host, port), timeout=timeout).close()
+        return True
+    except OSError:
+        return False
+
+
+def probe_qlever_server(endpoint_url: str) -> tuple[bool, bool]:
+    """
+    Helper function that checks if some process accepts connections on the
+    port of the given endpoint, and if so, if it is a QLever server. Return
+    the pair `(port_is_open, server_is_alive)`, so that the caller can tell
+    a free port from one used by another process with a single probe.
+    """
+
+    # If nothing accepts connections on the endpoint's port, there is no
+    # server, and we can save ourselves the `curl` process.
+    url = urlsplit(endpoint_url)
+    if url.hostname:
+        port = url.port or (443 if url.scheme == "https" else 80)
+        if not is_port_open(url.hostname, port):
+            return False, False
 
     message = "from the `qlever` CLI"
     curl_cmd = (
@@ -138,9 +165,17 @@ def is_qlever_server_alive(endpoint_url: str) -> bool:
     log.debug(curl_cmd)
     try:
         run_command(curl_cmd)
-        return True
+        return True, True
     except Exception:
-        return False
+        return True, False
+
+
+def is_qlever_server_alive(endpoint_url: str) -> bool:
+    """
+    Helper function that checks if a QLever server is running on the given
+    endpoint. Return `True` if the server is alive, `False` otherwise.
+    """
+    return probe_qlever_server(endpoint_url)[1]
 
 
 def get_existing_index_files(basename: str) -> list[str]:
@@ -148,14 +183,74 @@ def get_existing_index_files(basename: str) -> list[str]:
     Helper function that returns a list of all index files for `basename` in
     the current working directory.
     """
-    existing_index_files = []
-    existing_index_files.extend(Path.cwd().glob(f"{basename}.index.*"))
-    existing_index_files.extend(Path.cwd().glob(f"{basename}.text.*"))
-    existing_index_files.extend(Path.cwd().glob(f"{basename}.vocabulary.*"))
-    existing_index_files.extend(Path.cwd().glob(f"{basename}.meta-data.json"))
-    existing_index_files.extend(Path.cwd().glob(f"{basename}.prefixes"))
-    # Return only the file names, not the full paths.
-    return [path.name for path in existing_index_files]
+    patterns = [
+        f"{basename}.index.*",
+        f"{basename}.text.*",
+        f"{basename}.vocabulary.*",
+        f"{basename}.meta-data.json",
+        f"{basename}.prefixes",
+    ]
+    # Read the directory only once and match the names against all patterns
+    # (instead of one `glob` per pattern).
+    with os.scandir(Path.cwd()) as entries:
+        names = [entry.name for entry in entries]
+    return [
+        name for pattern in patterns for name in fnmatch.filter(names, pattern)
+    ]
+
+
+# The attributes of a process that are shown in the process table. Pass this
+# to `psutil.process_iter(attrs=...)` to fetch them for all processes in one
+# pass.
+PROCESS_INFO_ATTRS = [
+    "pid",
+    "username",
+    "create_time",
+    "memory_info",
+    "cmdline",
+]
+
+
+def get_process_info(psutil_process, attrs=PROCESS_INFO_ATTRS) -> dict:
+    """
+    Helper function that returns the given attributes of the given process as
+    a dict. If they have already been fetched (by `psutil.process_iter` with
+    `attrs=...`), they are taken from `psutil_process.info`, otherwise they
+    are fetched now.
+    """
+    pinfo = getattr(psutil_process, "info", None)
+    if isinstance(pinfo, dict) and all(attr in pinfo for attr in attrs):
+        return pinfo
+    return psutil_process.as_dict(attrs=attrs)
+
+
+def find_processes(cmdline_regex):
+    """
+    Helper function that yields `(psutil_process, pinfo, cmdline)` for each
+    running process whose command line matches the given regex (which can
+    also be given as a compiled pattern). Only the command line is fetched
+    for all processes, the other attributes from `PROCESS_INFO_ATTRS` only
+    for the matching ones (and stored in `psutil_process.info`). Processes
+    for which they cannot be retrieved are skipped.
+    """
+    # Imported here because `psutil` is expensive to import, and most
+    # commands do not look at processes.
+    import psutil
+
+    cmdline_pattern = re.compile(cmdline_regex)
+    for psutil_process in psutil.process_iter(attrs=["cmdline"]):
+        try:
+            # Note: the command line is `None` if the process is a zombie.
+            cmdline = get_process_info(psutil_process, ["cmdline"])["cmdline"]
+            cmdline = " ".join(cmdline or [])
+            if len(cmdline) == 0 or not cmdline_pattern.search(cmdline):
+                continue
+            pinfo = get_process_info(psutil_process)
+            psutil_process.info = pinfo
+        except Exception as e:
+            log.debug(f"Error getting process info: {e}")
+            continue
+        yield psutil_process, pinfo, cmdline
 
 
 def show_process_info(psutil_process, cmdline_regex, show_heading=True):
@@ -164,6 +259,7 @@ def show_process_info(psutil_process, cmdline_regex, show_heading=True):
     about the process can be retrieved and the command line matches the
     given regex (in which case the function returns `True`). The heading is
     only shown if `show_heading` is `True` and the function returns `True`.
+    The regex can also be given as a compiled pattern.
     """
 
     # Helper function that shows a line of the process table.
@@ -171,9 +267,7 @@ def show_process_info(psutil_process, cmdline_regex, show_heading=True):
         log.info(f"{pid:<8} {user:<8} {start_time:>5}  {rss:>5} {cmdline}")
 
     try:
-        pinfo = psutil_process.as_dict(
-            attrs=["pid", "username", "create_time", "memory_info", "cmdline"]
-        )
+        pinfo = get_process_info(psutil_process)
         # Note: pinfo[`cmdline`] is `None` if the process is a zombie.
         cmdline = " ".join(pinfo["cmdline"] or [])
         if len(cmdline) == 0 or not re.search(cmdline_regex, cmdline):
@@ -195,31 +289,51 @@ def show_process_info(psutil_process, cmdline_regex, show_heading=True):
         return False
 
 
+@lru_cache(maxsize=1)
+def get_qlever_version() -> str:
+    """
+    Helper function that returns the version of the installed `qlever`
+    package. Looking up the package metadata walks `sys.path`, so this is
+    only done once per run.
+    """
+    return version("qlever")
+
+
+def is_running_in_container() -> bool:
+    """
+    Helper function that returns `True` if the environment variable
+    `QLEVER_IS_RUNNING_IN_CONTAINER` is set, that is, if the `qlever` script
+    itself runs inside of a container.
+    """
+    return bool(os.environ.get("QLEVER_IS_RUNNING_IN_CONTAINER"))
+
+
 def get_random_string(length: int) -> str:
     """
     Helper function that returns a randomly chosen string of the given
-    length. Take the current time as seed.
+    length, consisting of ASCII letters and digits. The random bytes are
+    fetched in one batch instead of once per character. Bytes that would
+    make some characters more likely than others are discarded.
     """
     characters = string.ascii_letters + string.digits
-    return "".join(secrets.choice(characters) for _ in range(length))
+    limit = 256 - 256 % len(characters)
+    result = []
+    while len(result) < length:
+        for byte in secrets.token_bytes(length - len(result) + 8):
+            if byte < limit and len(result) < length:
+                result.append(characters[byte % len(characters)])
+    return "".join(result)
 
 
 def is_port_used(port: int) -> bool:
     """
-    Try to bind to the port on all interfaces to check if the port is already in use.
-    If the port is already in use, `socket.bind` will raise an `OSError` with errno EADDRINUSE.
+    Check if some process accepts TCP connections on the given port on
+    127.0.0.1 (with a short timeout). Note that this does not detect
+    processes that listen only on a single non-loopback address or only on
+    IPv6, although these can still keep another process from binding to the
+    port on all interfaces.
     """
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        # Ensure that the port is not blocked after the check.
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        sock.bind(("", port))
-        sock.close()
-        return False
-    except OSError as err:
-        if err.errno != errno.EADDRINUSE:
-            log.warning(f"Failed to determine if port is used: {err}")
-        return True
+    return is_port_open("127.0.0.1", port, timeout=0.05)
 
 
 def format_size(bytes, suffix="B"):
@@ -229,8 +343,8 @@ def format_size(bytes, suffix="B"):
         1253656 => '1.20MB'
         1253656678 => '1.17GB'
     """
-    factor = 1024
-    for unit in ["", "K", "M", "G", "T", "P"]:
-        if bytes < factor:
-            return f"{bytes:.2f} {unit}{suffix}"
-        bytes /= factor
+    # The unit is determined by the number of bits of the integer part,
+    # ten bits per unit, capped at the largest unit.
+    units = ["", "K", "M", "G", "T", "P"]
+    index = min(max(int(bytes).bit_length() - 1, 0) // 10, len(units) - 1)
+    return f"{bytes / (1 << (10 * index)):.2f} {units[index]}{suffix}"
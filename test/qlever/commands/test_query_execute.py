@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock, patch
+
+from qlever.commands.query import QueryCommand
+
+
+def get_mock_args():
+    args = MagicMock()
+    args.query = "SELECT * WHERE { ?s ?p ?o }"
+    args.pin_to_cache = True
+    args.access_token = "TestToken"
+    args.sparql_endpoint = None
+    args.port = 7001
+    args.show = False
+    args.no_time = True
+    return args
+
+
+# Tests that the result size of a pinned query is read from the JSON result
+# and logged with grouped digits
+@patch("qlever.commands.query.log")
+@patch("qlever.commands.query.run_command")
+def test_execute_pin_to_cache(mock_run_command, mock_log):
+    mock_run_command.return_value = '{"resultsize": 1234567}'
+
+    assert QueryCommand().execute(get_mock_args())
+    assert mock_run_command.call_args.kwargs == {"return_output": True}
+    mock_log.info.assert_called_once_with(
+        "Result pinned to cache, number of rows: 1,234,567")
+    mock_log.error.assert_not_called()
+
+
+# Tests that an error reported by QLever is logged instead of failing with a
+# `KeyError` for the missing result size
+@patch("qlever.commands.query.log")
+@patch("qlever.commands.query.run_command")
+def test_execute_pin_to_cache_exception(mock_run_command, mock_log):
+    mock_run_command.return_value = (
+        '{"exception": "Invalid access token", "status": "ERROR"}')
+
+    assert not QueryCommand().execute(get_mock_args())
+    mock_log.error.assert_called_once_with(
+        "Pinning the result to the cache failed: Invalid access token")
+    mock_log.info.assert_not_called()
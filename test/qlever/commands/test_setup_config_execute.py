@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from qlever.commands.setup_config import (SetupConfigCommand,
+                                          get_qleverfile_names)
+
+QLEVERFILE = """[server]
+PORT               = 7019
+ACCESS_TOKEN       = ${data:NAME}_7643543846
+
+[runtime]
+SYSTEM = docker
+IMAGE  = docker.io/adfreiburg/qlever:latest
+"""
+
+
+class TestSetupConfigCommand(unittest.TestCase):
+    def setUp(self):
+        # Run each test in a fresh directory with a single pre-configured
+        # Qleverfile `Qleverfile.test` in the subdirectory `Qleverfiles`.
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        Path("Qleverfiles").mkdir()
+        Path("Qleverfiles/Qleverfile.test").write_text(QLEVERFILE)
+        self.sc = SetupConfigCommand()
+        self.sc.qleverfiles_path = Path("Qleverfiles").absolute()
+        self.args = MagicMock()
+        self.args.config_name = "test"
+        self.args.show = False
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    @patch("qlever.commands.setup_config.is_running_in_container",
+           return_value=False)
+    @patch("qlever.commands.setup_config.get_random_string")
+    def test_execute_appends_to_access_token(self, mock_random, mock_env):
+        mock_random.return_value = "RANDOMSTRING"
+
+        # Execute the function
+        result = self.sc.execute(self.args)
+
+        # Only the access token is changed.
+        self.assertTrue(result)
+        self.assertEqual(
+            Path("Qleverfile").read_text(),
+            QLEVERFILE.replace("_7643543846", "_7643543846_RANDOMSTRING"),
+        )
+
+    @patch("qlever.commands.setup_config.is_running_in_container",
+           return_value=True)
+    @patch("qlever.commands.setup_config.get_random_string")
+    def test_execute_in_container_sets_system_native(self, mock_random,
+                                                     mock_env):
+        mock_random.return_value = "RANDOMSTRING"
+
+        # Execute the function
+        result = self.sc.execute(self.args)
+
+        # The access token is changed and the system is set to native.
+        self.assertTrue(result)
+        self.assertEqual(
+            Path("Qleverfile").read_text(),
+            QLEVERFILE.replace("_7643543846", "_7643543846_RANDOMSTRING")
+            .replace("SYSTEM = docker", "SYSTEM = native"),
+        )
+
+    def test_get_qleverfile_names(self):
+        Path("Qleverfiles/Qleverfile.test-2").touch()
+        Path("Qleverfiles/Qleverfile.").touch()
+        Path("Qleverfiles/README.md").touch()
+
+        # Only the names after `Qleverfile.` are returned.
+        names = get_qleverfile_names(Path("Qleverfiles").absolute())
+        self.assertEqual(sorted(names), ["test", "test-2"])
+
+    def test_execute_existing_qleverfile(self):
+        Path("Qleverfile").write_text("existing")
+
+        # Execute the function
+        result = self.sc.execute(self.args)
+
+        # The existing Qleverfile is not overwritten.
+        self.assertFalse(result)
+        self.assertEqual(Path("Qleverfile").read_text(), "existing")
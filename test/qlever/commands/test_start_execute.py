@@ -1,5 +1,9 @@
+import sys
+import time
 import unittest
 from unittest.mock import patch, MagicMock, call
+
+import pytest
 from qlever.commands.start import StartCommand
 import qlever.commands.start
 
@@ -104,18 +108,62 @@ def test_run_command_in_container(mock_containerize):
     assert result == start_command
 
 
+# Tests the check_binary help function for the case that the binary is found
+# and not run
+@patch('qlever.commands.start.shutil.which')
+@patch('qlever.commands.start.run_command')
+def test_check_binary_found(mock_run_cmd, mock_which):
+    # Setup args
+    args = MagicMock()
+    args.server_binary = "/test/path/server_binary"
+    mock_which.return_value = args.server_binary
+
+    # Execute the function
+    result = qlever.commands.start.check_binary(args.server_binary)
+    # check that the binary was looked up, but not run
+    mock_which.assert_called_once_with(args.server_binary)
+    mock_run_cmd.assert_not_called()
+    assert result
+
+
+# Tests the check_binary help function for the case that the binary is not
+# found (or not executable)
+@patch('qlever.commands.start.shutil.which')
+@patch('qlever.commands.start.run_command')
+@patch('qlever.commands.start.log')
+def test_check_binary_not_found(mock_log, mock_run_cmd, mock_which):
+    # Setup args
+    args = MagicMock()
+    args.server_binary = "false_binary"
+    mock_which.return_value = None
+
+    # Execute the function
+    result = qlever.commands.start.check_binary(args.server_binary,
+                                                run_help=True)
+    # check that the binary was not run and the error message was logged
+    mock_run_cmd.assert_not_called()
+    mock_log.error.assert_called_once_with(
+        'Binary "false_binary" not found or not executable, set'
+        ' `--server-binary` to a different binary or set `--system to a'
+        ' container system`')
+    assert not result
+
+
 # Tests the check_binary help function for the case of success of the
 # run_cmd in the try/except block
+@patch('qlever.commands.start.shutil.which')
 @patch('qlever.commands.start.run_command')
-def test_check_binary_success(mock_run_cmd):
+def test_check_binary_success(mock_run_cmd, mock_which):
     # Setup args
     args = MagicMock()
     args.server_binary = "/test/path/server_binary"
+    mock_which.return_value = args.server_binary
     # mock run_cmd as successful
     mock_run_cmd.return_value = "Command works"
 
     # Execute the function
-    result = qlever.commands.start.check_binary(args.server_binary)
+    result = qlever.commands.start.check_binary(args.server_binary,
+                                                run_help=True)
     # check if run_cmd was called once with
     mock_run_cmd.assert_called_once_with(f"{args.server_binary} --help")
     assert result
@@ -123,18 +171,21 @@ def test_check_binary_success(mock_run_cmd):
 
 # Tests the check_binary help function for the case of exception for the
 # run_cmd in the try/except block
+@patch('qlever.commands.start.shutil.which')
 @patch('qlever.commands.start.run_command')
 @patch('qlever.commands.start.log')
-def test_check_binary_exception(mock_log, mock_run_cmd):
+def test_check_binary_exception(mock_log, mock_run_cmd, mock_which):
     # Setup args
     args = MagicMock()
     args.server_binary = "false_binary"
+    mock_which.return_value = "/usr/bin/false_binary"
 
     # Simulate an exception when run_command is called
     mock_run_cmd.side_effect = Exception("Mocked command failure")
 
     # Execute the function
-    result = qlever.commands.start.check_binary(args.server_binary)
+    result = qlever.commands.start.check_binary(args.server_binary,
+                                                run_help=True)
 
     # check if run_cmd was called once with
     mock_run_cmd.assert_called_once_with(f"{args.server_binary} --help")
@@ -148,134 +199,319 @@ def test_check_binary_exception(mock_log, mock_run_cmd):
     assert not result
 
 
-# Tests the setting_index_description help function for the case of success
-# of the run_cmd in the try/except block
-@patch('qlever.commands.start.run_command')
+# Tests that send_api_request sends the parameters URL-encoded to the `/api`
+# endpoint of the server
 @patch('qlever.commands.start.log')
-def test_setting_index_description_success(mock_log, mock_run_cmd):
-    # Setup args
-    args = MagicMock()
-    args.access_token = True
-    args.port = 1234
-    args.description = "TestDescription"
-    access_arg = f"--data-urlencode \"access-token={args.access_token}\""
+def test_send_api_request(mock_log):
+    connection = MagicMock()
+    connection.host = "localhost"
+    connection.port = 1234
+    connection.getresponse.return_value.status = 200
 
     # Execute the function
-    qlever.commands.start.setting_index_description(access_arg, args.port,
-                                                        args.description)
+    qlever.commands.start.send_api_request(
+        connection, {"index-description": "Test & Description",
+                     "access-token": "TestToken"})
+
     # Asserts
-    curl_cmd = (f"curl -Gs http://localhost:{args.port}/api"
-                f" --data-urlencode \"index-description={args.description}\""
-                f" {access_arg} > /dev/null")
-    # Verify that the debug message was logged
-    mock_log.debug.assert_called_once_with(curl_cmd)
-    # check if run_cmd was called once with correct parameters
-    mock_run_cmd.assert_called_once_with(curl_cmd)
+    path = ("/api?index-description=Test+%26+Description"
+            "&access-token=TestToken")
+    connection.request.assert_called_once_with("GET", path)
+    connection.getresponse.return_value.read.assert_called_once()
+    # Verify that the equivalent curl command was logged
+    mock_log.debug.assert_called_once_with(
+        f"curl -Gs 'http://localhost:1234{path}'")
+
+
+# Tests that send_api_request raises an exception if the server does not
+# accept the request
+def test_send_api_request_error_status():
+    connection = MagicMock()
+    connection.getresponse.return_value.status = 403
+    connection.getresponse.return_value.reason = "Forbidden"
 
+    # Execute the function
+    with pytest.raises(Exception, match="HTTP status 403 Forbidden"):
+        qlever.commands.start.send_api_request(
+            connection, {"index-description": "TestDescription"})
 
-# Tests the setting_index_description help function for the case of exception
-# for the run_cmd in the try/except block
-@patch('qlever.commands.start.run_command')
-@patch('qlever.commands.start.log')
-def test_setting_index_description_exception(mock_log, mock_run_cmd):
-    # Setup args
-    args = MagicMock()
-    args.access_token = True
-    args.port = 1234
-    args.description = "ErrorDescription"
-    access_arg = f"--data-urlencode \"access-token={args.access_token}\""
 
-    # Simulate an exception when run_command is called
-    mock_run_cmd.side_effect = Exception("Mocked command failure")
+# Tests the setting_index_description help function for the case of success
+# of the send_api_request in the try/except block
+@patch('qlever.commands.start.send_api_request')
+@patch('qlever.commands.start.log')
+def test_setting_index_description_success(mock_log, mock_send_api_request):
+    mock_connection = MagicMock()
 
     # Execute the function
-    qlever.commands.start.setting_index_description(access_arg, args.port,
-                                                        args.description)
+    result = qlever.commands.start.setting_index_description(
+        mock_connection, "TestDescription", "TestToken")
+
+    # check if send_api_request was called once with correct parameters
+    mock_send_api_request.assert_called_once_with(
+        mock_connection, {"index-description": "TestDescription",
+                          "access-token": "TestToken"})
+    mock_log.error.assert_not_called()
+    assert result
 
-    # Asserts
-    curl_cmd = (f"curl -Gs http://localhost:{args.port}/api"
-                f" --data-urlencode \"index-description={args.description}\""
-                f" {access_arg} > /dev/null")
-    # Verify that the debug message was logged
-    mock_log.debug.assert_called_once_with(curl_cmd)
-    # check if run_cmd was called once with correct parameters
-    mock_run_cmd.assert_called_once_with(curl_cmd)
+
+# Tests the setting_index_description help function for the case of exception
+# for the send_api_request in the try/except block
+@patch('qlever.commands.start.send_api_request')
+@patch('qlever.commands.start.log')
+def test_setting_index_description_exception(mock_log, mock_send_api_request):
+    mock_connection = MagicMock()
+    # Simulate an exception when send_api_request is called
+    mock_send_api_request.side_effect = Exception("Mocked request failure")
+
+    # Execute the function (without access token)
+    result = qlever.commands.start.setting_index_description(
+        mock_connection, "ErrorDescription", None)
+
+    # check if send_api_request was called once with correct parameters
+    mock_send_api_request.assert_called_once_with(
+        mock_connection, {"index-description": "ErrorDescription"})
     # Verify that the error message was logged
     mock_log.error.assert_called_once_with(
-        f"Setting the index description failed (Mocked command failure)")
+        "Setting the index description failed (Mocked request failure)")
+    assert not result
 
 
 # Tests the setting_text_description help function for the case of success
-# of the run_cmd in the try/except block
-@patch('qlever.commands.start.run_command')
+# of the send_api_request in the try/except block
+@patch('qlever.commands.start.send_api_request')
 @patch('qlever.commands.start.log')
-def test_setting_text_description_success(mock_log, mock_run_cmd):
-    # Setup args
-    args = MagicMock()
-    args.access_token = True
-    args.port = 1234
-    args.description = "TestDescription"
-    access_arg = f"--data-urlencode \"access-token={args.access_token}\""
+def test_setting_text_description_success(mock_log, mock_send_api_request):
+    mock_connection = MagicMock()
 
     # Execute the function
-    qlever.commands.start.setting_text_description(access_arg, args.port,
-                                                        args.description)
-    # Asserts
-    curl_cmd = (f"curl -Gs http://localhost:{args.port}/api"
-                f" --data-urlencode \"text-description={args.description}\""
-                f" {access_arg} > /dev/null")
-    # Verify that the debug message was logged
-    mock_log.debug.assert_called_once_with(curl_cmd)
-    # check if run_cmd was called once with correct parameters
-    mock_run_cmd.assert_called_once_with(curl_cmd)
+    result = qlever.commands.start.setting_text_description(
+        mock_connection, "TestDescription", "TestToken")
+
+    # check if send_api_request was called once with correct parameters
+    mock_send_api_request.assert_called_once_with(
+        mock_connection, {"text-description": "TestDescription",
+                          "access-token": "TestToken"})
+    mock_log.error.assert_not_called()
+    assert result
 
 
 # Tests the setting_text_description help function for the case of exception
-# for the run_cmd in the try/except block
-@patch('qlever.commands.start.run_command')
+# for the send_api_request in the try/except block
+@patch('qlever.commands.start.send_api_request')
 @patch('qlever.commands.start.log')
-def test_setting_text_description_exception(mock_log, mock_run_cmd):
-    # Setup args
-    args = MagicMock()
-    args.access_token = True
-    args.port = 1234
-    args.description = "ErrorDescription"
-    access_arg = f"--data-urlencode \"access-token={args.access_token}\""
+def test_setting_text_description_exception(mock_log, mock_send_api_request):
+    mock_connection = MagicMock()
+    # Simulate an exception when send_api_request is called
+    mock_send_api_request.side_effect = Exception("Mocked request failure")
+
+    # Execute the function (without access token)
+    result = qlever.commands.start.setting_text_description(
+        mock_connection, "ErrorDescription", None)
+
+    # check if send_api_request was called once with correct parameters
+    mock_send_api_request.assert_called_once_with(
+        mock_connection, {"text-description": "ErrorDescription"})
+    # Verify that the error message was logged
+    mock_log.error.assert_called_once_with(
+        "Setting the text description failed (Mocked request failure)")
+    assert not result
 
-    # Simulate an exception when run_command is called
-    mock_run_cmd.side_effect = Exception("Mocked command failure")
+
+# Tests that setting_descriptions sets both descriptions with a single request
+@patch('qlever.commands.start.send_api_request')
+def test_setting_descriptions_at_once(mock_send_api_request):
+    mock_connection = MagicMock()
 
     # Execute the function
-    qlever.commands.start.setting_text_description(access_arg, args.port,
-                                                        args.description)
+    result = qlever.commands.start.setting_descriptions(
+        mock_connection, "TestDescription", "TestTextDescription",
+        "TestToken")
+
+    # check if send_api_request was called once with all parameters
+    mock_send_api_request.assert_called_once_with(
+        mock_connection, {"index-description": "TestDescription",
+                          "text-description": "TestTextDescription",
+                          "access-token": "TestToken"})
+    assert result
 
-    # Asserts
-    curl_cmd = (f"curl -Gs http://localhost:{args.port}/api"
-                f" --data-urlencode \"text-description={args.description}\""
-                f" {access_arg} > /dev/null")
-    # Verify that the debug message was logged
-    mock_log.debug.assert_called_once_with(curl_cmd)
-    # check if run_cmd was called once with correct parameters
-    mock_run_cmd.assert_called_once_with(curl_cmd)
-    # Verify that the error message was logged
-    mock_log.error.assert_called_once_with(
-        f"Setting the text description failed (Mocked command failure)")
+
+# Tests that setting_descriptions falls back to one request per description
+# if the single request fails
+@patch('qlever.commands.start.send_api_request')
+def test_setting_descriptions_one_by_one(mock_send_api_request):
+    mock_connection = MagicMock()
+    mock_send_api_request.side_effect = [Exception("Mocked failure"),
+                                         None, None]
+
+    # Execute the function (without access token)
+    result = qlever.commands.start.setting_descriptions(
+        mock_connection, "TestDescription", "TestTextDescription", None)
+
+    # check that the descriptions were set one by one after the failure
+    mock_send_api_request.assert_has_calls([
+        call(mock_connection, {"index-description": "TestDescription",
+                               "text-description": "TestTextDescription"}),
+        call(mock_connection, {"index-description": "TestDescription"}),
+        call(mock_connection, {"text-description": "TestTextDescription"})])
+    assert result
+
+
+# Tests that setting_descriptions does nothing without descriptions
+@patch('qlever.commands.start.send_api_request')
+def test_setting_descriptions_none(mock_send_api_request):
+    assert qlever.commands.start.setting_descriptions(
+        MagicMock(), None, "", "TestToken")
+    mock_send_api_request.assert_not_called()
+
+
+# Tests that wait_until_server_is_alive polls with exponential backoff that is
+# capped at the given maximal delay.
+@patch('qlever.commands.start.is_qlever_server_alive')
+@patch('qlever.commands.start.time.sleep')
+def test_wait_until_server_is_alive(mock_sleep, mock_is_qlever_server_alive):
+    # Server is alive after the fifth check
+    mock_is_qlever_server_alive.side_effect = [False, False, False, False,
+                                               True]
+
+    # Execute the function
+    assert qlever.commands.start.wait_until_server_is_alive(
+        "http://localhost:1234", initial_delay=0.1, max_delay=0.3)
+
+    # Check that the server was checked five times and the delays grew
+    assert mock_is_qlever_server_alive.call_count == 5
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert delays == pytest.approx([0.1, 0.15, 0.225, 0.3])
+
+
+# Tests that wait_until_server_is_alive waits on the given ready event instead
+# of sleeping, as long as the event is not set.
+@patch('qlever.commands.start.is_qlever_server_alive')
+@patch('qlever.commands.start.time.sleep')
+def test_wait_until_server_is_alive_with_ready_event(
+        mock_sleep, mock_is_qlever_server_alive):
+    # Server is alive after the second check
+    mock_is_qlever_server_alive.side_effect = [False, True]
+    ready_event = MagicMock()
+    ready_event.is_set.return_value = False
+
+    # Execute the function
+    qlever.commands.start.wait_until_server_is_alive(
+        "http://localhost:1234", initial_delay=0.1, ready_event=ready_event)
+
+    # Check that the event was waited on and that there was no sleep
+    ready_event.wait.assert_called_once_with(0.1)
+    mock_sleep.assert_not_called()
+
+
+# Tests that wait_until_server_is_alive stops waiting when the server process
+# has exited.
+@patch('qlever.commands.start.is_qlever_server_alive', return_value=False)
+@patch('qlever.commands.start.time.sleep')
+def test_wait_until_server_is_alive_process_exited(
+        mock_sleep, mock_is_qlever_server_alive):
+    # The process exits after the second check
+    process = MagicMock()
+    process.poll.side_effect = [None, 1]
+
+    # Execute the function
+    assert not qlever.commands.start.wait_until_server_is_alive(
+        "http://localhost:1234", process=process)
+
+    # Check that the server was only checked until the process had exited
+    assert mock_is_qlever_server_alive.call_count == 2
+    assert mock_sleep.call_count == 1
+
+
+# Tests that LogTailer prints the lines already in the log file as well as the
+# lines that are appended later, until it is stopped.
+def test_log_tailer(tmp_path, capsys):
+    log_file = tmp_path / "test.server-log.txt"
+    log_file.write_text("line 1\n")
+
+    # Follow the log file and append to it
+    log_tailer = qlever.commands.start.LogTailer(log_file,
+                                                 poll_interval=0.01)
+    log_tailer.start()
+    with open(log_file, "a") as f:
+        f.write("line 2\n")
+    time.sleep(0.1)
+    log_tailer.stop()
+
+    # Check that both lines were printed and the thread has ended
+    assert capsys.readouterr().out == "line 1\nline 2\n"
+    assert not log_tailer.is_alive()
+
+
+# Tests that LogTailer sets its ready event when the marker appears.
+def test_log_tailer_ready_marker(tmp_path):
+    log_file = tmp_path / "test.server-log.txt"
+    log_file.write_text("starting\n")
+
+    # Follow the log file, the marker is not there yet
+    log_tailer = qlever.commands.start.LogTailer(
+        log_file, poll_interval=0.01, ready_marker="The server is ready")
+    log_tailer.start()
+    assert not log_tailer.ready.wait(0.05)
+
+    # Append the marker
+    with open(log_file, "a") as f:
+        f.write("The server is ready, listening for requests\n")
+    assert log_tailer.ready.wait(5)
+    log_tailer.stop()
+
+
+# Tests that LogTailer can be stopped when the log file never appears.
+def test_log_tailer_without_log_file(tmp_path, capsys):
+    log_tailer = qlever.commands.start.LogTailer(tmp_path / "missing.txt",
+                                                 poll_interval=0.01)
+    log_tailer.start()
+    log_tailer.stop()
+    assert capsys.readouterr().out == ""
+    assert not log_tailer.is_alive()
+
+
+# Tests that start_server_natively runs the command in its own session with
+# its output redirected to the log file.
+def test_start_server_natively(tmp_path):
+    log_file = tmp_path / "test.server-log.txt"
+    start_argv = [sys.executable, "-c",
+                  "import os, sys; print('out', flush=True);"
+                  " print('err', file=sys.stderr, flush=True);"
+                  " print(os.getsid(0) == os.getpid())"]
+
+    # Execute the function and wait for the process to finish
+    proc = qlever.commands.start.start_server_natively(start_argv, log_file)
+    assert proc.wait(timeout=10) == 0
+
+    # Check the output in the log file
+    assert log_file.read_text() == "out\nerr\nTrue\n"
 
 
 class TestStartCommand(unittest.TestCase):
 
+    @patch('qlever.commands.start.is_port_open', return_value=False)
+    @patch('qlever.commands.start.probe_qlever_server',
+           return_value=(False, False))
+    @patch('qlever.commands.start.shutil.which',
+           return_value="/test/path/server_binary")
+    @patch('qlever.commands.start.send_api_request')
     @patch('qlever.commands.start.CacheStatsCommand.execute')
     @patch('qlever.commands.stop.StopCommand.execute', return_value=True)
     @patch('qlever.commands.start.run_command')
     @patch('qlever.commands.start.is_qlever_server_alive')
-    @patch('subprocess.Popen')
+    @patch('qlever.commands.start.start_server_natively')
     @patch('qlever.commands.start.Containerize')
     # Tests if killing existing server and restarting a new one works.
     # Also checks the start_command for all the extra options enabled.
     def test_execute_kills_existing_server_on_same_port(self,
-                                mock_containerize, mock_popen,
+                                mock_containerize, mock_start_natively,
                                 mock_is_qlever_server_alive, mock_run_command,
-                                mock_stop, mock_cache_stats_command):
+                                mock_stop, mock_cache_stats_command,
+                                mock_send_api_request,
+                                mock_which,
+                                mock_probe_qlever_server,
+                                mock_is_port_open):
         # Setup args
         args = MagicMock()
         args.kill_existing_with_same_port = True
@@ -289,6 +525,7 @@ class TestStartCommand(unittest.TestCase):
         args.cache_max_num_entries = 1000
         args.system = "native"
         args.show = False
+        args.check_server_binary = True
         args.no_warmup = True
         args.timeout = True
         args.access_token = True
@@ -302,11 +539,9 @@ class TestStartCommand(unittest.TestCase):
         # Mock Containerize
         mock_containerize.return_value = None
 
-        # Mock server is not alive initially, then alive after starting
-        mock_is_qlever_server_alive.side_effect = [False, True]
-
-        # Mock Popen
-        mock_popen.return_value = MagicMock()
+        # Mock server is not running initially (see the patch of
+        # `probe_qlever_server`), then alive after starting
+        mock_is_qlever_server_alive.return_value = True
 
         # Instantiate the StartCommand
         sc = StartCommand()
@@ -320,37 +555,38 @@ class TestStartCommand(unittest.TestCase):
         # Server status should be checked
         mock_is_qlever_server_alive.assert_called()
 
+        # Ensure the binary was checked
+        mock_run_command.assert_called_once_with(
+                                                f"{args.server_binary} --help")
         # Ensure the server was started
-        run_call_1 = f"{args.server_binary} --help"
-        start_command = (f"{args.server_binary}"
-                        f" -i {args.name}"
-                        f" -j {args.num_threads}"
-                        f" -p {args.port}"
-                        f" -m {args.memory_for_queries}"
-                        f" -c {args.cache_max_size}"
-                        f" -e {args.cache_max_size_single_entry}"
-                        f" -k {args.cache_max_num_entries}"
-                        f" -s {args.timeout}"
-                        f" -a {args.access_token}"
-                        " --only-pso-and-pos-permutations"
-                        " --no-patterns"
-                        " -t"
-                        f" > {args.name}.server-log.txt 2>&1")
-        run_call_2 = f"nohup {start_command} &"
-        # Assert that run_command was called exactly twice with the
-        # correct arguments in order
-        mock_run_command.assert_has_calls([call(run_call_1), call(run_call_2)],
-                                          any_order=False)
+        start_argv = [f"{args.server_binary}",
+                      "-i", f"{args.name}",
+                      "-j", f"{args.num_threads}",
+                      "-p", f"{args.port}",
+                      "-m", f"{args.memory_for_queries}",
+                      "-c", f"{args.cache_max_size}",
+                      "-e", f"{args.cache_max_size_single_entry}",
+                      "-k", f"{args.cache_max_num_entries}",
+                      "-s", f"{args.timeout}",
+                      "-a", f"{args.access_token}",
+                      "--only-pso-and-pos-permutations",
+                      "--no-patterns",
+                      "-t"]
+        mock_start_natively.assert_called_once_with(
+            start_argv, f"{args.name}.server-log.txt")
         # Ensure execution was successful
         self.assertTrue(result)
 
 
+    @patch('qlever.commands.start.shutil.which',
+           return_value="/test/path/server_binary")
     @patch('qlever.commands.start.run_command')
-    @patch('qlever.commands.start.is_qlever_server_alive')
+    @patch('qlever.commands.start.probe_qlever_server')
     @patch('qlever.commands.start.Containerize')
     def test_execute_fails_due_to_existing_server(self, mock_containerize,
-                                                  mock_is_qlever_server_alive,
-                                                  mock_run_command):
+                                                  mock_probe_qlever_server,
+                                                  mock_run_command,
+                                                  mock_which):
         # Setup args
         args = MagicMock()
         args.kill_existing_with_same_port = False
@@ -366,9 +602,10 @@ class TestStartCommand(unittest.TestCase):
         args.cache_max_num_entries = 1000
         args.system = "native"
         args.show = False
+        args.check_server_binary = True
 
         # Mock the QLever server as already running
-        mock_is_qlever_server_alive.return_value = True
+        mock_probe_qlever_server.return_value = (True, True)
 
         # Mock Containerize
         mock_containerize.return_value = None
@@ -382,7 +619,7 @@ class TestStartCommand(unittest.TestCase):
         # Assertions
         # Ensure the server status was checked
         endpoint_url = f"http://localhost:{args.port}"
-        mock_is_qlever_server_alive.assert_called_once_with(endpoint_url)
+        mock_probe_qlever_server.assert_called_once_with(endpoint_url)
         # Check that `run_command` was called only for the `--help` check,
         # but not the actual start command
         mock_run_command.assert_called_once_with(
@@ -390,16 +627,24 @@ class TestStartCommand(unittest.TestCase):
         # The function should return False if the server is already running
         self.assertFalse(result)
 
+    @patch('qlever.commands.start.probe_qlever_server',
+           return_value=(False, False))
+    @patch('qlever.commands.start.shutil.which',
+           return_value="/test/path/server_binary")
+    @patch('qlever.commands.start.send_api_request')
     @patch('qlever.commands.start.CacheStatsCommand.execute')
     @patch('qlever.commands.start.run_command')
     @patch('qlever.commands.start.is_qlever_server_alive')
-    @patch('subprocess.Popen')
+    @patch('qlever.commands.start.start_server_natively')
     @patch('qlever.commands.start.Containerize')
     @patch('time.sleep')
     def test_execute_successful_server_start(self, mock_sleep,
-                                mock_containerize, mock_popen,
+                                mock_containerize, mock_start_natively,
                                 mock_is_qlever_server_alive, mock_run_command,
-                                mock_cache_stats_command):
+                                mock_cache_stats_command,
+                                mock_send_api_request,
+                                mock_which,
+                                mock_probe_qlever_server):
         # Setup args
         args = MagicMock()
         args.kill_existing_with_same_port = False
@@ -415,11 +660,9 @@ class TestStartCommand(unittest.TestCase):
         args.show = False
         args.no_warmup = True
 
-        # Mock server is not alive initially, then alive after starting
-        mock_is_qlever_server_alive.side_effect = [False, True]
-
-        # Mock Popen
-        mock_popen.return_value = MagicMock()
+        # Mock server is not running initially (see the patch of
+        # `probe_qlever_server`), then alive after starting
+        mock_is_qlever_server_alive.return_value = True
 
         # Mock CacheStatsCommand
         mock_cache_stats_command.return_value = None
@@ -440,19 +683,29 @@ class TestStartCommand(unittest.TestCase):
         # Server status should be checked
         mock_is_qlever_server_alive.assert_called()
         # Ensure the server was started
-        self.assertTrue(mock_run_command.called)
+        self.assertTrue(mock_start_natively.called)
         # Ensure execution was successful
         self.assertTrue(result)
 
+    @patch('qlever.commands.start.probe_qlever_server',
+           return_value=(False, False))
+    @patch('qlever.commands.start.shutil.which',
+           return_value="/test/path/server_binary")
+    @patch('qlever.commands.start.send_api_request')
     @patch('qlever.commands.start.CacheStatsCommand.execute')
     @patch('qlever.commands.start.run_command')
     @patch('qlever.commands.start.is_qlever_server_alive')
-    @patch('subprocess.Popen')
+    @patch('qlever.commands.start.start_server_natively')
+    @patch('qlever.commands.start.LogTailer')
     @patch('subprocess.run')
     @patch('qlever.commands.start.Containerize')
     def test_execute_server_with_warmup(self, mock_containerize, mock_run,
-                                mock_popen, mock_is_qlever_server_alive,
-                                mock_run_command, mock_cache_stats_command):
+                                mock_log_tailer, mock_start_natively,
+                                mock_is_qlever_server_alive,
+                                mock_run_command, mock_cache_stats_command,
+                                mock_send_api_request,
+                                mock_which,
+                                mock_probe_qlever_server):
         # Setup args
         args = MagicMock()
         args.kill_existing_with_same_port = False
@@ -469,17 +722,15 @@ class TestStartCommand(unittest.TestCase):
         args.warmup_cmd = "test_warmup_command"
         args.no_warmup = False
 
-        # Mock Popen
-        mock_popen.return_value = MagicMock()
-
         # Mock CacheStatsCommand
         mock_cache_stats_command.return_value = None
 
         # Mock Containerize
         mock_containerize.return_value = None
 
-        # Mock that no server is currently running
-        mock_is_qlever_server_alive.side_effect = [False, True]
+        # Mock that no server is currently running (see the patch of
+        # `probe_qlever_server`), and that it is alive after starting
+        mock_is_qlever_server_alive.return_value = True
 
         # Instantiate the StartCommand
         sc = StartCommand()
@@ -487,9 +738,13 @@ class TestStartCommand(unittest.TestCase):
         # Execute the function
         result = sc.execute(args)
 
-        # Check that Popen was called
-        mock_popen.assert_called_once_with(
-            f"exec tail -f {args.name}.server-log.txt", shell=True)
+        # Check that the server log was followed and that following it was
+        # stopped again
+        mock_log_tailer.assert_called_once_with(
+            f"{args.name}.server-log.txt",
+            ready_marker=qlever.commands.start.SERVER_READY_MARKER)
+        mock_log_tailer.return_value.start.assert_called_once()
+        mock_log_tailer.return_value.stop.assert_called_once()
 
         # Check warmup was called
         mock_run.assert_called_once_with(
@@ -499,10 +754,15 @@ class TestStartCommand(unittest.TestCase):
         # Ensure the server status was checked
         mock_is_qlever_server_alive.assert_called()
         # Ensure the server was started
-        mock_run_command.assert_called()
+        mock_start_natively.assert_called_once()
         # Execution should succeed
         self.assertTrue(result)
 
+    @patch('qlever.commands.start.is_port_open', return_value=False)
+    @patch('qlever.commands.start.probe_qlever_server',
+           return_value=(False, False))
+    @patch('qlever.commands.start.open_api_connection')
+    @patch('qlever.commands.start.send_api_request')
     @patch('qlever.commands.start.CacheStatsCommand.execute')
     @patch('qlever.commands.stop.StopCommand.execute', return_value=True)
     @patch('qlever.commands.start.run_command')
@@ -515,7 +775,11 @@ class TestStartCommand(unittest.TestCase):
                                 mock_construct_cl, mock_run_containerize,
                                 mock_containerize, mock_popen,
                                 mock_is_qlever_server_alive, mock_run_command,
-                                mock_stop, mock_cache_stats_command):
+                                mock_stop, mock_cache_stats_command,
+                                mock_send_api_request,
+                                mock_open_api_connection,
+                                mock_probe_qlever_server,
+                                mock_is_port_open):
         # Setup args
         args = MagicMock()
         args.kill_existing_with_same_port = True
@@ -533,8 +797,9 @@ class TestStartCommand(unittest.TestCase):
         args.text_description = "TestTextDescription"
         args.access_token = "TestToken"
 
-        # Mock server is not alive initially, then alive after starting
-        mock_is_qlever_server_alive.side_effect = [False, True]
+        # Mock server is not running initially (see the patch of
+        # `probe_qlever_server`), then alive after starting
+        mock_is_qlever_server_alive.return_value = True
 
         # Mock Popen
         mock_popen.return_value = MagicMock()
@@ -567,24 +832,210 @@ class TestStartCommand(unittest.TestCase):
         # Calls for run command
         run_call_1 = f"{args.system} rm -f {args.server_container}"
         run_call_2 = "TestStart2"
-        access_arg = f"--data-urlencode \"access-token={args.access_token}\""
-        run_call_3 = (f"curl -Gs http://localhost:{args.port}/api"
-                f" --data-urlencode \"index-description={args.description}\""
-                f" {access_arg} > /dev/null")
-        run_call_4 = (f"curl -Gs http://localhost:{args.port}/api"
-                    f" --data-urlencode \"text-description="
-                    f"{args.text_description}\""
-                    f" {access_arg} > /dev/null")
-        # Assert that run_command was called exactly 4 times with the
+        # Assert that run_command was called exactly twice with the
         # correct arguments in order
-        mock_run_command.assert_has_calls([call(run_call_1), call(run_call_2),
-                                        call(run_call_3), call(run_call_4)],
+        mock_run_command.assert_has_calls([call(run_call_1), call(run_call_2)],
                                         any_order=False)
+        # Assert that the index and text description were set with one
+        # request, and that the connection was closed afterwards
+        mock_open_api_connection.assert_called_once_with(args.port)
+        connection = mock_open_api_connection.return_value
+        mock_send_api_request.assert_called_once_with(
+            connection, {"index-description": args.description,
+                         "text-description": args.text_description,
+                         "access-token": args.access_token})
+        connection.close.assert_called_once()
         # Server status should be checked
         mock_is_qlever_server_alive.assert_called()
         # Ensure execution was successful
         self.assertTrue(result)
 
+    @patch('qlever.commands.start.is_port_open', return_value=False)
+    @patch('qlever.commands.start.StatusCommand.execute')
+    @patch('qlever.commands.stop.StopCommand.execute', return_value=True)
+    @patch('qlever.commands.start.run_command')
+    @patch('qlever.commands.start.probe_qlever_server')
+    @patch('qlever.commands.start.Containerize.supported_systems',
+           return_value=("docker", "podman"))
+    def test_execute_removes_container_before_alive_check(
+            self, mock_supported_systems, mock_probe_qlever_server,
+            mock_run_command, mock_stop, mock_status, mock_is_port_open):
+        # Setup args
+        args = MagicMock()
+        args.kill_existing_with_same_port = True
+        args.port = 1234
+        args.system = "docker"
+        args.server_container = "TestContainer"
+        args.show = False
+
+        # The old server runs in the container, so it is alive until the
+        # container is removed. After that, the port is mocked to be still in
+        # use by another process, so that the command stops after the checks
+        events = []
+        mock_run_command.side_effect = (
+            lambda cmd: events.append(cmd))
+        mock_probe_qlever_server.side_effect = (
+            lambda url: events.append(url) or (True, len(events) == 1))
+
+        # Execute the function
+        StartCommand().execute(args)
+
+        # The container was removed before the server was checked, so the
+        # old server was not considered to be still running
+        self.assertEqual(events[:2], [f"docker rm -f {args.server_container}",
+                                      f"http://localhost:{args.port}"])
+        mock_status.assert_not_called()
+
+    @patch('qlever.commands.start.start_server_natively')
+    @patch('qlever.commands.start.run_command')
+    @patch('qlever.commands.start.probe_qlever_server',
+           return_value=(True, False))
+    @patch('qlever.commands.start.shutil.which',
+           return_value="/test/path/server_binary")
+    def test_execute_fails_due_to_port_in_use(self, mock_which,
+                                              mock_probe_qlever_server,
+                                              mock_run_command,
+                                              mock_start_natively):
+        # Setup args
+        args = MagicMock()
+        args.kill_existing_with_same_port = False
+        args.port = 1234
+        args.server_binary = "/test/path/server_binary"
+        args.system = "native"
+        args.show = False
+
+        # Execute the function
+        result = StartCommand().execute(args)
+
+        # The port was probed only once and the server was not started
+        mock_probe_qlever_server.assert_called_once_with(
+            f"http://localhost:{args.port}")
+        mock_start_natively.assert_not_called()
+        self.assertFalse(result)
+
+    @patch('qlever.commands.start.LogTailer')
+    @patch('qlever.commands.start.start_server_natively')
+    @patch('qlever.commands.start.is_qlever_server_alive', return_value=False)
+    @patch('qlever.commands.start.probe_qlever_server',
+           return_value=(False, False))
+    @patch('qlever.commands.start.shutil.which',
+           return_value="/test/path/server_binary")
+    def test_execute_fails_when_server_exits(self, mock_which,
+                                             mock_probe_qlever_server,
+                                             mock_is_qlever_server_alive,
+                                             mock_start_natively,
+                                             mock_log_tailer):
+        # Setup args
+        args = MagicMock()
+        args.kill_existing_with_same_port = False
+        args.port = 1234
+        args.server_binary = "/test/path/server_binary"
+        args.name = "TestName"
+        args.system = "native"
+        args.show = False
+        args.check_server_binary = False
+
+        # Mock a server binary that is found, but exits right away
+        mock_start_natively.return_value.poll.return_value = 127
+        mock_start_natively.return_value.returncode = 127
+
+        # Execute the function
+        result = StartCommand().execute(args)
+
+        # We did not wait for the server forever, and stopped following
+        # the log
+        mock_is_qlever_server_alive.assert_called_once()
+        mock_log_tailer.return_value.stop.assert_called_once()
+        self.assertFalse(result)
+
+    @patch('qlever.commands.start.start_server_natively')
+    @patch('qlever.commands.start.probe_qlever_server',
+           return_value=(False, False))
+    @patch('qlever.commands.start.shutil.which', return_value=None)
+    @patch.dict('os.environ', {"HOME": "/home/test", "QLEVER": "/opt/qlever"})
+    def test_execute_expands_server_binary(self, mock_which,
+                                           mock_probe_qlever_server,
+                                           mock_start_natively):
+        # Setup args
+        args = MagicMock()
+        args.kill_existing_with_same_port = False
+        args.port = 1234
+        args.system = "native"
+        args.show = False
+        args.check_server_binary = False
+
+        # `~` and environment variables are expanded before the lookup
+        for binary, expanded in [("~/build/ServerMain",
+                                  "/home/test/build/ServerMain"),
+                                 ("$QLEVER/build/ServerMain",
+                                  "/opt/qlever/build/ServerMain")]:
+            args.server_binary = binary
+            self.assertFalse(StartCommand().execute(args))
+            mock_which.assert_called_with(expanded)
+        mock_start_natively.assert_not_called()
+
+    @patch('qlever.commands.start.start_server_natively')
+    @patch('qlever.commands.start.is_port_open')
+    @patch('qlever.commands.start.time.sleep')
+    @patch('qlever.commands.stop.StopCommand.execute', return_value=True)
+    @patch('qlever.commands.start.probe_qlever_server')
+    @patch('qlever.commands.start.shutil.which',
+           return_value="/test/path/server_binary")
+    def test_execute_waits_for_port_of_killed_server(
+            self, mock_which, mock_probe_qlever_server, mock_stop,
+            mock_sleep, mock_is_port_open, mock_start_natively):
+        # Setup args
+        args = MagicMock()
+        args.kill_existing_with_same_port = True
+        args.port = 1234
+        args.server_binary = "/test/path/server_binary"
+        args.system = "native"
+        args.show = False
+        args.check_server_binary = False
+
+        # The killed server keeps its port open for two more checks. The
+        # probe would report the port as used by another process if it came
+        # before the port was closed
+        events = []
+        mock_is_port_open.side_effect = (
+            lambda host, port: events.append("port") or len(events) < 3)
+        mock_probe_qlever_server.side_effect = (
+            lambda url: events.append("probe") or (events[-2] != "port",
+                                                   False))
+        mock_start_natively.side_effect = Exception("not started in test")
+
+        # Execute the function (it stops at the mocked start)
+        self.assertFalse(StartCommand().execute(args))
+
+        # The probe only happened after the port was closed, so the server
+        # was started
+        self.assertEqual(events, ["port", "port", "port", "probe"])
+        self.assertEqual(mock_sleep.call_count, 2)
+        mock_start_natively.assert_called_once()
+
+    @patch('qlever.commands.start.time.monotonic')
+    @patch('qlever.commands.start.time.sleep')
+    @patch('qlever.commands.start.is_port_open', return_value=True)
+    @patch('qlever.commands.stop.StopCommand.execute', return_value=True)
+    @patch('qlever.commands.start.probe_qlever_server')
+    def test_execute_port_of_killed_server_stays_open(
+            self, mock_probe_qlever_server, mock_stop, mock_is_port_open,
+            mock_sleep, mock_monotonic):
+        # Setup args
+        args = MagicMock()
+        args.kill_existing_with_same_port = True
+        args.port = 1234
+        args.system = "native"
+        args.show = False
+
+        # The port is still open when the timeout has passed
+        mock_monotonic.side_effect = [0.0, 10.0, 31.0]
+
+        # Execute the function, it gives up without probing the port
+        self.assertFalse(StartCommand().execute(args))
+        self.assertEqual(mock_sleep.call_count, 1)
+        mock_probe_qlever_server.assert_not_called()
+
     # check if execute returns False for args.show = True
     @patch('qlever.commands.start.construct_command_line')
     def test_execute_show(self, mock_construct_cmd_line):
@@ -43,6 +43,10 @@ class TestStartCommand(unittest.TestCase):
         # Parse an empty argument list to see the default
         args = parser.parse_args([])
 
+        # Test that the default value for --check-server-binary is set
+        # correctly
+        self.assertEqual(args.check_server_binary, False)
+
         # Test that the default value for cmdline_regex is set correctly
         self.assertEqual(args.kill_existing_with_same_port, False)
 
@@ -1,3 +1,4 @@
+import re
 import sys
 import unittest
 from io import StringIO
@@ -28,7 +29,9 @@ class TestStatusCommand(unittest.TestCase):
 
         # Creating mock psutil.Process objects with necessary attributes
         mock_process1 = MagicMock()
-        mock_process1.as_dict.return_value = {"test": [1]}
+        mock_process1.as_dict.return_value = {
+            "cmdline": ["ServerMain", "-i", "test1"]
+        }
         # to test with real psutil.process objects use this:
         """mock_process1.as_dict.return_value = {
             'cmdline': ['cmdline1'],
@@ -39,7 +42,9 @@ class TestStatusCommand(unittest.TestCase):
         }"""
 
         mock_process2 = MagicMock()
-        mock_process2.as_dict.return_value = {"test": [2]}
+        mock_process2.as_dict.return_value = {
+            "cmdline": ["ServerMain", "-i", "test2"]
+        }
         # to test with real psutil.process objects use this:
         """mock_process2.as_dict.return_value = {
             'cmdline': ['cmdline2'],
@@ -50,7 +55,9 @@ class TestStatusCommand(unittest.TestCase):
         }"""
 
         mock_process3 = MagicMock()
-        mock_process3.as_dict.return_value = {"test": [3]}
+        mock_process3.as_dict.return_value = {
+            "cmdline": ["ServerMain", "-i", "test3"]
+        }
 
         # Mock the return value of process_iter
         # to be a list of these mocked process objects
@@ -69,15 +76,17 @@ class TestStatusCommand(unittest.TestCase):
         # Execute the function
         result = sc.execute(args)
 
-        # Assert that process_iter was called once
-        mock_process_iter.assert_called_once()
+        # Assert that process_iter was called once, fetching only the
+        # command line of each process
+        mock_process_iter.assert_called_once_with(attrs=["cmdline"])
 
         # Assert that show_process_info was called 3times
         # in correct order with the correct arguments
+        cmdline_pattern = re.compile(args.cmdline_regex)
         expected_calls = [
-            call(mock_process1, args.cmdline_regex, show_heading=True),
-            call(mock_process2, args.cmdline_regex, show_heading=True),
-            call(mock_process3, args.cmdline_regex, show_heading=False),
+            call(mock_process1, cmdline_pattern, show_heading=True),
+            call(mock_process2, cmdline_pattern, show_heading=True),
+            call(mock_process3, cmdline_pattern, show_heading=False),
         ]
         mock_show_process_info.assert_has_calls(
             expected_calls, any_order=False
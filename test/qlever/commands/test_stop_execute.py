@@ -140,7 +140,12 @@ class TestStopCommand(unittest.TestCase):
             only_show=False,
         )
         mock_process_iter.assert_not_called()
-        mock_stop_and_remove_container.assert_called_once()
+        # All container systems are tried
+        self.assertEqual(
+            sorted(c.args for c in
+                   mock_stop_and_remove_container.call_args_list),
+            [("docker", "test_container"), ("podman", "test_container")],
+        )
         mock_status_execute.assert_not_called()
         self.assertTrue(result)
 
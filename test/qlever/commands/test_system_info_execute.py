@@ -0,0 +1,61 @@
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from qlever.commands.system_info import (get_partition,
+                                         get_partitions_by_mountpoint,
+                                         get_user_info)
+
+
+# Tests that get_partition returns the partition with the longest mountpoint
+# that contains the directory
+@patch("psutil.disk_partitions")
+def test_get_partition(mock_disk_partitions):
+    root, home = MagicMock(mountpoint="/"), MagicMock(mountpoint="/home")
+    mock_disk_partitions.return_value = [root, home]
+    get_partitions_by_mountpoint.cache_clear()
+    assert get_partition(Path("/home/foo/bar")) is home
+    assert get_partition(Path("/home")) is home
+    assert get_partition(Path("/homework")) is root
+    # The partitions were only fetched once
+    mock_disk_partitions.assert_called_once_with(all=False)
+    mock_disk_partitions.return_value = [home]
+    get_partitions_by_mountpoint.cache_clear()
+    assert get_partition(Path("/usr")) is None
+    get_partitions_by_mountpoint.cache_clear()
+
+
+# Tests that get_user_info reports the effective user and group and all groups
+# of the current process, in the format of `id`
+@pytest.mark.skipif(sys.platform == "win32", reason="requires Unix")
+def test_get_user_info():
+    import grp
+    import pwd
+
+    # The expected `id(name)`, or only `id` if there is no name for it
+    def with_name(id, get_name):
+        try:
+            return f"{id}({get_name(id)})"
+        except KeyError:
+            return f"{id}"
+
+    uid, gid = os.geteuid(), os.getegid()
+    fields = dict(field.split("=", 1) for field in get_user_info().split())
+    assert sorted(fields) == ["gid", "groups", "uid"]
+    assert fields["uid"] == with_name(uid, lambda id: pwd.getpwuid(id).pw_name)
+    assert fields["gid"] == with_name(gid, lambda id: grp.getgrgid(id).gr_name)
+    groups = fields["groups"].split(",")
+    assert groups[0] == fields["gid"]
+    assert {int(group.split("(")[0]) for group in groups} == {
+        gid, *os.getgroups()}
+
+
+# Tests that get_user_info shows only the id if there is no name for it
+@pytest.mark.skipif(sys.platform == "win32", reason="requires Unix")
+@patch("pwd.getpwuid", side_effect=KeyError("uid not found"))
+def test_get_user_info_without_name(mock_getpwuid):
+    uid = os.geteuid()
+    assert get_user_info().startswith(f"uid={uid} gid=")
@@ -0,0 +1,184 @@
+import subprocess
+import unittest
+from unittest.mock import MagicMock, patch
+
+from qlever.commands.ui import UiCommand
+
+
+def get_mock_args(pull):
+    args = MagicMock()
+    args.host_name = "localhost"
+    args.port = 7001
+    args.ui_port = 8176
+    args.ui_config = "test"
+    args.ui_system = "docker"
+    args.ui_image = "docker.io/adfreiburg/qlever-ui"
+    args.ui_container = "qlever.ui.test"
+    args.pull = pull
+    args.show = False
+    return args
+
+
+PULL_ARGV = ["docker", "pull", "-q", "docker.io/adfreiburg/qlever-ui"]
+
+
+@patch("qlever.commands.ui.subprocess.run")
+@patch("qlever.commands.ui.subprocess.Popen")
+@patch("qlever.commands.ui.Containerize.image_exists")
+@patch("qlever.commands.ui.Containerize.stop_and_remove_containers")
+@patch("qlever.commands.ui.is_port_used", return_value=False)
+@patch("qlever.commands.ui.is_running_in_container", return_value=False)
+class TestUiCommand(unittest.TestCase):
+    def test_execute_pull_always(self, mock_in_container, mock_port_used,
+                                 mock_stop, mock_image_exists, mock_popen,
+                                 mock_run):
+        mock_popen.return_value.wait.return_value = 0
+
+        # Execute the function
+        self.assertTrue(UiCommand().execute(get_mock_args("always")))
+
+        # The image was pulled without looking for a local image first
+        mock_image_exists.assert_not_called()
+        self.assertEqual(mock_popen.call_args.args[0], PULL_ARGV)
+        mock_popen.return_value.wait.assert_called_once()
+        self.assertEqual(mock_run.call_count, 2)
+
+    def test_execute_pull_missing_image_present(
+            self, mock_in_container, mock_port_used, mock_stop,
+            mock_image_exists, mock_popen, mock_run):
+        mock_image_exists.return_value = True
+
+        # Execute the function
+        self.assertTrue(UiCommand().execute(get_mock_args("missing")))
+
+        # The image is available locally, so it was not pulled
+        mock_image_exists.assert_called_once_with(
+            "docker", "docker.io/adfreiburg/qlever-ui")
+        mock_popen.assert_not_called()
+        self.assertEqual(mock_run.call_count, 2)
+
+    def test_execute_pull_missing_image_absent(
+            self, mock_in_container, mock_port_used, mock_stop,
+            mock_image_exists, mock_popen, mock_run):
+        mock_image_exists.return_value = False
+        mock_popen.return_value.wait.return_value = 0
+
+        # Execute the function
+        self.assertTrue(UiCommand().execute(get_mock_args("missing")))
+
+        # The image is not available locally, so it was pulled
+        mock_image_exists.assert_called_once()
+        self.assertEqual(mock_popen.call_args.args[0], PULL_ARGV)
+        self.assertEqual(mock_run.call_count, 2)
+
+    def test_execute_pull_never(self, mock_in_container, mock_port_used,
+                                mock_stop, mock_image_exists, mock_popen,
+                                mock_run):
+        # Execute the function
+        self.assertTrue(UiCommand().execute(get_mock_args("never")))
+
+        # Neither was the image pulled nor looked up
+        mock_image_exists.assert_not_called()
+        mock_popen.assert_not_called()
+        self.assertEqual(mock_run.call_count, 2)
+
+    @patch("qlever.commands.ui.UiCommand.show")
+    def test_execute_show_pull(self, mock_show, mock_in_container,
+                               mock_port_used, mock_stop, mock_image_exists,
+                               mock_popen, mock_run):
+        pull_cmd = "docker pull -q docker.io/adfreiburg/qlever-ui"
+        shown = {}
+        for pull in ["always", "missing", "never"]:
+            args = get_mock_args(pull)
+            args.show = True
+            self.assertTrue(UiCommand().execute(args))
+            shown[pull] = mock_show.call_args.args[0].splitlines()
+
+        # The pull is shown unconditionally, conditionally, or not at all
+        self.assertEqual(shown["always"][1], pull_cmd)
+        self.assertEqual(
+            shown["missing"][1],
+            f"docker image inspect docker.io/adfreiburg/qlever-ui "
+            f"> /dev/null 2>&1 || {pull_cmd}")
+        self.assertNotIn(pull_cmd, "\n".join(shown["never"]))
+        mock_image_exists.assert_not_called()
+        mock_popen.assert_not_called()
+        mock_run.assert_not_called()
+
+    def test_execute_pulls_in_background(self, mock_in_container,
+                                         mock_port_used, mock_stop,
+                                         mock_image_exists, mock_popen,
+                                         mock_run):
+        events = []
+        mock_popen.side_effect = lambda argv, **kwargs: (
+            events.append("pull started") or mock_popen.return_value)
+        mock_popen.return_value.wait.side_effect = lambda: (
+            events.append("pull waited") or 0)
+        mock_stop.side_effect = lambda name: events.append("stop")
+        mock_port_used.side_effect = lambda port: events.append("port")
+        mock_run.side_effect = lambda argv, **kwargs: events.append(argv[1])
+
+        # Execute the function
+        self.assertTrue(UiCommand().execute(get_mock_args("always")))
+
+        # The containers were stopped and the port was checked while the
+        # image was pulled, and the pull was finished before the start
+        self.assertEqual(events, ["pull started", "stop", "port",
+                                  "pull waited", "run", "exec"])
+
+    @patch("qlever.commands.ui.log")
+    def test_execute_pull_fails(self, mock_log, mock_in_container,
+                                mock_port_used, mock_stop, mock_image_exists,
+                                mock_popen, mock_run):
+        mock_popen.return_value.wait.return_value = 1
+
+        # Execute the function
+        self.assertTrue(UiCommand().execute(get_mock_args("always")))
+
+        # There was a warning, and the UI was started with the local image
+        mock_log.warning.assert_called_once()
+        self.assertIn("Pulling the image",
+                      mock_log.warning.call_args.args[0])
+        self.assertEqual(mock_run.call_count, 2)
+
+    def test_execute_pull_not_possible(self, mock_in_container,
+                                       mock_port_used, mock_stop,
+                                       mock_image_exists, mock_popen,
+                                       mock_run):
+        mock_popen.side_effect = FileNotFoundError("docker")
+
+        # Execute the function, the container system is not installed
+        self.assertFalse(UiCommand().execute(get_mock_args("always")))
+        mock_run.assert_not_called()
+
+    def test_execute_start_fails(self, mock_in_container, mock_port_used,
+                                 mock_stop, mock_image_exists, mock_popen,
+                                 mock_run):
+        mock_popen.return_value.wait.return_value = 0
+
+        # The `run` fails, so the `exec` is not attempted
+        mock_run.side_effect = subprocess.CalledProcessError(125, "run")
+        self.assertFalse(UiCommand().execute(get_mock_args("always")))
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertTrue(mock_run.call_args.kwargs["check"])
+
+        # The container system is not installed
+        mock_run.reset_mock()
+        mock_run.side_effect = FileNotFoundError("docker")
+        self.assertFalse(UiCommand().execute(get_mock_args("never")))
+        self.assertEqual(mock_run.call_count, 1)
+
+    def test_execute_commands_without_shell(self, mock_in_container,
+                                            mock_port_used, mock_stop,
+                                            mock_image_exists, mock_popen,
+                                            mock_run):
+        # Execute the function
+        self.assertTrue(UiCommand().execute(get_mock_args("never")))
+
+        # The `exec` command is split into its arguments, and only the shell
+        # inside the container is started
+        exec_argv = mock_run.call_args_list[1].args[0]
+        self.assertEqual(exec_argv, [
+            "docker", "exec", "-it", "qlever.ui.test", "bash", "-c",
+            "python manage.py configure test http://localhost:7001"])
+        self.assertNotIn("shell", mock_run.call_args_list[1].kwargs)
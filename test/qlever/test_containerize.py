@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+from qlever.containerize import Containerize
+
+
+# Tests that no command is run if the container system is not installed, and
+# that the `PATH` is only searched once per container system
+@patch("qlever.containerize.subprocess.run")
+@patch("qlever.containerize.shutil.which", return_value=None)
+def test_stop_and_remove_container_not_installed(mock_which, mock_run):
+    Containerize.is_installed.cache_clear()
+    assert not Containerize.stop_and_remove_container("docker", "container")
+    assert not Containerize.stop_and_remove_container("docker", "container")
+    mock_which.assert_called_once_with("docker")
+    mock_run.assert_not_called()
+    Containerize.is_installed.cache_clear()
+
+
+@patch("qlever.containerize.subprocess.run")
+@patch("qlever.containerize.shutil.which", return_value="/usr/bin/podman")
+def test_stop_and_remove_container_installed(mock_which, mock_run):
+    Containerize.is_installed.cache_clear()
+    assert Containerize.stop_and_remove_container("podman", "container")
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0] == (
+        "podman stop container && podman rm container"
+    )
+    Containerize.is_installed.cache_clear()
+
+
+# Tests that the container is stopped for all supported systems, and that
+# only the systems where a container was found are returned
+@patch("qlever.containerize.Containerize.stop_and_remove_container")
+def test_stop_and_remove_containers(mock_stop_and_remove_container):
+    mock_stop_and_remove_container.side_effect = (
+        lambda system, name: system == "podman")
+    assert Containerize.stop_and_remove_containers("container") == ["podman"]
+    calls = mock_stop_and_remove_container.call_args_list
+    assert sorted(c.args for c in calls) == [("docker", "container"),
+                                             ("podman", "container")]
+
+
+# Tests that image_exists asks the container system for the local image
+@patch("qlever.containerize.subprocess.run")
+def test_image_exists(mock_run):
+    mock_run.return_value.returncode = 0
+    assert Containerize.image_exists("docker", "test/image")
+    assert mock_run.call_args.args[0] == ["docker", "image", "inspect",
+                                          "test/image"]
+    mock_run.return_value.returncode = 1
+    assert not Containerize.image_exists("docker", "test/image")
+    # The container system is not installed
+    mock_run.side_effect = FileNotFoundError("docker")
+    assert not Containerize.image_exists("docker", "test/image")
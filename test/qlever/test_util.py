@@ -1,4 +1,10 @@
-from qlever.util import get_random_string
+import socket
+from unittest.mock import MagicMock, patch
+
+from qlever.util import (PROCESS_INFO_ATTRS, find_processes, format_size,
+                         get_existing_index_files, get_process_info,
+                         get_random_string, is_port_used,
+                         is_qlever_server_alive, probe_qlever_server)
 
 
 def test_get_random_string():
@@ -7,3 +13,105 @@ def test_get_random_string():
     assert len(random_string_1) == 20
     assert len(random_string_2) == 20
     assert random_string_1 != random_string_2
+    assert get_random_string(0) == ""
+    assert get_random_string(1000).isalnum()
+
+
+def test_format_size():
+    assert format_size(0) == "0.00 B"
+    assert format_size(1023) == "1023.00 B"
+    assert format_size(1024) == "1.00 KB"
+    assert format_size(1253656) == "1.20 MB"
+    assert format_size(1253656678) == "1.17 GB"
+    assert format_size(2048 * 1024**5) == "2048.00 PB"
+    assert format_size(1024, suffix="iB") == "1.00 KiB"
+
+
+def test_get_existing_index_files(tmp_path, monkeypatch):
+    for file_name in ["test.index.pso", "test.vocabulary.internal",
+                      "test.meta-data.json", "test.prefixes",
+                      "test.settings.json", "other.index.pso"]:
+        (tmp_path / file_name).touch()
+    monkeypatch.chdir(tmp_path)
+    assert sorted(get_existing_index_files("test")) == [
+        "test.index.pso", "test.meta-data.json", "test.prefixes",
+        "test.vocabulary.internal"]
+
+
+@patch("qlever.util.run_command")
+def test_is_qlever_server_alive(mock_run_command):
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        sock.listen()
+        port = sock.getsockname()[1]
+        # Something listens on the port, so ask it via `curl`.
+        assert is_qlever_server_alive(f"http://localhost:{port}")
+        mock_run_command.assert_called_once()
+    # Nothing listens on the port anymore, so `curl` is not even started.
+    mock_run_command.reset_mock()
+    assert not is_qlever_server_alive(f"http://localhost:{port}")
+    mock_run_command.assert_not_called()
+
+
+@patch("qlever.util.run_command")
+def test_probe_qlever_server(mock_run_command):
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        sock.listen()
+        port = sock.getsockname()[1]
+        # The port is open, and the process there answers the ping.
+        assert probe_qlever_server(f"http://localhost:{port}") == (True, True)
+        # The port is open, but the process there is no QLever server.
+        mock_run_command.side_effect = Exception("curl failed")
+        assert probe_qlever_server(f"http://localhost:{port}") == (True, False)
+    # Nothing listens on the port anymore.
+    assert probe_qlever_server(f"http://localhost:{port}") == (False, False)
+
+
+def test_get_process_info():
+    # Attributes already fetched by `psutil.process_iter(attrs=...)`.
+    proc = MagicMock()
+    proc.info = {"pid": 1, "cmdline": ["ServerMain"]}
+    assert get_process_info(proc, ["cmdline"]) == proc.info
+    proc.as_dict.assert_not_called()
+    # Not all attributes fetched yet.
+    proc.as_dict.return_value = {"pid": 1, "username": "user"}
+    expected = {"pid": 1, "username": "user"}
+    assert get_process_info(proc, ["pid", "username"]) == expected
+    proc.as_dict.assert_called_once_with(attrs=["pid", "username"])
+    # Attributes not fetched yet.
+    proc = MagicMock(spec=["as_dict"])
+    proc.as_dict.return_value = {"pid": 2, "cmdline": None}
+    assert get_process_info(proc) == {"pid": 2, "cmdline": None}
+
+
+@patch("psutil.process_iter")
+def test_find_processes(mock_process_iter):
+    server, builder, zombie, gone = (MagicMock(), MagicMock(), MagicMock(),
+                                     MagicMock(spec=["as_dict"]))
+    server.info = {"cmdline": ["ServerMain", "-p", "7001"]}
+    server.as_dict.return_value = {"pid": 1, "username": "user",
+                                   "create_time": 0, "memory_info": None,
+                                   "cmdline": ["ServerMain", "-p", "7001"]}
+    builder.info = {"cmdline": ["IndexBuilderMain", "-i", "x"]}
+    zombie.info = {"cmdline": None}
+    gone.as_dict.side_effect = Exception("No such process")
+    mock_process_iter.return_value = [server, builder, zombie, gone]
+    # Only the matching process is returned, the others are skipped.
+    assert list(find_processes("^ServerMain.* -p 7001")) == [
+        (server, server.as_dict.return_value, "ServerMain -p 7001")]
+    mock_process_iter.assert_called_once_with(attrs=["cmdline"])
+    # Only for the matching process, all attributes were fetched.
+    server.as_dict.assert_called_once_with(attrs=PROCESS_INFO_ATTRS)
+    builder.as_dict.assert_not_called()
+    assert server.info == server.as_dict.return_value
+
+
+def test_is_port_used():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        port = sock.getsockname()[1]
+        assert is_port_used(port)
+    # Once the socket is closed, nothing listens on the port anymore.
+    assert not is_port_used(port)